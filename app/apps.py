@@ -8,3 +8,5 @@ class AppConfig(AppConfig):
         # Import the template tags when the app is ready
         from django.template.defaulttags import register
         from .templatetags import table_filters
+        # Connect the hooks that bump the configuration version on every write
+        from . import config_version
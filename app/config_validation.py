@@ -0,0 +1,72 @@
+import json
+import logging
+from .export import record_types_for_export, record_types_with_fields, export_record_type_fields
+from .utils.record_type_validator import iter_validate_record_types
+from .utils.record_field_validator import iter_validate_record_fields, build_field_key_index
+from .utils.record_type_catalog import RecordTypeCatalog
+from .utils.validation_stats import collect_results
+from .utils.validation_trace import ValidationTrace
+from .utils.ingestion_schema import coerce_record
+from .utils.constants import CONFIG_VALIDATION_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+def iter_record_type_rows():
+    """
+    Yield each RecordType in the RecordTypes upload format. RowKey is the
+    record type name, matching the PartitionKey of its exported fields.
+    Costs two queries per chunk of record types.
+    """
+    record_types = record_types_for_export()
+    for record in record_types.iterator(chunk_size=CONFIG_VALIDATION_CHUNK_SIZE):
+        yield coerce_record({
+            'RowKey': record.name,
+            'Prefix': record.prefix,
+            'Description': record.description,
+            'Category': record.category,
+            'Color': record.colour,
+            'IsActive': record.is_enabled,
+            'IsCorrespondenceType': record.enable_correspondence,
+            'Order': record.order,
+            'StagesJson': json.dumps([{
+                'Name': stage.name,
+                'Order': stage.order
+            } for stage in record.stages.all()])
+        }, 'record_types')
+
+def iter_record_field_rows():
+    """
+    Yield every core field, custom field and role in the RecordFields upload
+    format, built by the same code as the field export. Costs four queries
+    per chunk of record types.
+    """
+    record_types = record_types_with_fields()
+    for record in record_types.iterator(chunk_size=CONFIG_VALIDATION_CHUNK_SIZE):
+        for field in export_record_type_fields(record):
+            yield coerce_record(field, 'record_fields')
+
+def validate_current_configuration():
+    """
+    Validate the configuration stored in the database with the upload rule
+    engine, returning (success, record_type_results, field_results).
+    """
+    # The catalog is filled while the types are validated
+    record_types = RecordTypeCatalog()
+    record_type_results = collect_results(
+        iter_validate_record_types(record_types.collect(iter_record_type_rows()))
+    )
+
+    # First pass keeps only the (PartitionKey, RowKey) index, second pass validates
+    key_index = build_field_key_index(iter_record_field_rows())
+    trace = ValidationTrace('Current configuration validation')
+    field_results = collect_results(iter_validate_record_fields(
+        iter_record_field_rows(),
+        record_types=record_types,
+        key_index=key_index,
+        trace=trace
+    ))
+    field_results.trace = trace.finish()
+
+    success = record_type_results.success and field_results.success
+    logger.info(f"Current configuration validation complete. Success: {success}")
+    return success, record_type_results, field_results
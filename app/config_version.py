@@ -0,0 +1,64 @@
+import logging
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from .models import ConfigurationVersion, RecordType, Stage, CoreField, CustomField, Role
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_SCOPE = 'global'
+
+def record_type_scope(record_type_id):
+    return f"record_type:{record_type_id}"
+
+def increment_scope(scope, now):
+    return ConfigurationVersion.objects.filter(scope=scope).update(version=F('version') + 1, modified_at=now)
+
+def bump_configuration_version(record_type_id=None):
+    """Count a configuration write globally and, when given, against its record type"""
+    now = timezone.now()
+    scopes = [GLOBAL_SCOPE]
+    if record_type_id is not None:
+        scopes.append(record_type_scope(record_type_id))
+    for scope in scopes:
+        # An F() increment so concurrent writes never share a version; the row
+        # is only created on the scope's first write
+        if increment_scope(scope, now):
+            continue
+        try:
+            with transaction.atomic():
+                ConfigurationVersion.objects.create(scope=scope, version=1, modified_at=now)
+        except IntegrityError:
+            # A concurrent first write created it
+            increment_scope(scope, now)
+
+def configuration_version(record_type_id=None):
+    """
+    The (version, modified_at) of the whole configuration, or of one record
+    type; (0, None) before the first write.
+    """
+    scope = GLOBAL_SCOPE if record_type_id is None else record_type_scope(record_type_id)
+    row = ConfigurationVersion.objects.filter(scope=scope).values_list('version', 'modified_at').first()
+    return row or (0, None)
+
+@receiver(post_save, sender=RecordType, dispatch_uid='config_version_record_type')
+def record_type_changed(sender, instance, **kwargs):
+    bump_configuration_version(instance.pk)
+
+@receiver(post_delete, sender=RecordType, dispatch_uid='config_version_record_type_deleted')
+def record_type_deleted(sender, instance, **kwargs):
+    # One bump covers the record type and everything cascaded with it
+    bump_configuration_version()
+    ConfigurationVersion.objects.filter(scope=record_type_scope(instance.pk)).delete()
+
+# Parts are only hooked on save: a delete listener would stop Django
+# fast-deleting them in a record type's cascade, so the views that delete a
+# single part call bump_configuration_version themselves
+@receiver(post_save, sender=Stage, dispatch_uid='config_version_stage')
+@receiver(post_save, sender=CoreField, dispatch_uid='config_version_core_field')
+@receiver(post_save, sender=CustomField, dispatch_uid='config_version_custom_field')
+@receiver(post_save, sender=Role, dispatch_uid='config_version_role')
+def record_type_part_changed(sender, instance, **kwargs):
+    bump_configuration_version(instance.record_type_id)
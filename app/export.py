@@ -1,59 +1,127 @@
+import csv
+import io
 import json
-from typing import List, Dict, Any
+import logging
+import sys
+import zipfile
+from typing import List, Dict, Any, Iterator
+from django.core.cache import caches
 from django.core.serializers.json import DjangoJSONEncoder
-from app.models import RecordType
+from django.db.models import Prefetch
+from app.models import RecordType, Stage, Role, CoreField, CustomField
+from app.utils.validation_report import EchoBuffer
+from app.utils.constants import EXPORT_CHUNK_SIZE, EXPORT_FORMAT_VERSION, EXPORT_CACHE_MAX_BYTES
 from collections import OrderedDict
 
-def export_record_types(selected_types: List[str] = None) -> str:
+logger = logging.getLogger(__name__)
+
+EXPORT_CACHE_ALIAS = 'exports'
+
+# Export query plan: every relation an export touches is fetched up front, so
+# the number of queries is fixed however many record types, fields and roles
+# there are. Rows must be built from the prefetched managers (.all(), no
+# further filtering or ordering) or Django falls back to a query per object.
+
+def record_types_for_export(selected_types: List[str] = None):
+    """RecordTypes with their stages in order: two queries in all."""
+    record_types = RecordType.objects.prefetch_related(
+        Prefetch('stages', queryset=Stage.objects.order_by('order'))
+    )
+    if selected_types:
+        record_types = record_types.filter(name__in=selected_types)
+    return record_types
+
+def record_types_with_fields(selected_types: List[str] = None):
+    """RecordTypes with their core fields, custom fields and roles (with stages): four queries in all."""
+    record_types = RecordType.objects.prefetch_related(
+        'core_fields',
+        'custom_fields',
+        Prefetch('role_set', queryset=Role.objects.select_related('stage'))
+    )
+    if selected_types:
+        record_types = record_types.filter(name__in=selected_types)
+    return record_types
+
+def export_record_type_fields(record_type_obj):
+    """export_record_fields for a RecordType fetched by record_types_with_fields."""
+    return export_record_fields(
+        record_type_obj,
+        record_type_obj.custom_fields.all(),
+        record_type_obj.role_set.all(),
+        record_type_obj.core_fields.all()
+    )
+
+def iter_record_type_fields(record_type_obj):
+    """
+    Stream a RecordType's fields, core fields and roles from lazy querysets:
+    three queries, with no more than a chunk of rows in memory at a time.
+    """
+    return iter_record_fields_export(
+        record_type_obj,
+        CustomField.objects.filter(record_type=record_type_obj).iterator(chunk_size=EXPORT_CHUNK_SIZE),
+        Role.objects.filter(record_type=record_type_obj).select_related('stage').iterator(chunk_size=EXPORT_CHUNK_SIZE),
+        CoreField.objects.filter(record_type=record_type_obj).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+def record_type_export_row(record) -> Dict[str, Any]:
+    """A RecordType as an Azure Table Storage RecordTypes entity."""
+    # Convert stages to StagesJson format (prefetched in order)
+    stages_json = json.dumps([{
+        "Name": stage.name,
+        "Order": stage.order
+    } for stage in record.stages.all()])
+
+    # Use OrderedDict to maintain field order
+    return OrderedDict([
+        ("odata.type", "briefconnectabcsa.RecordTypes"),
+        ("odata.id", f"https://briefconnectabcsa.table.core.windows.net/RecordTypes(PartitionKey='V1',RowKey='{record.name}')"),
+        ("odata.editLink", f"RecordTypes(PartitionKey='V1',RowKey='{record.name}')"),
+        ("PartitionKey", "V1"),
+        ("RowKey", f"{record.name} ({record.prefix})"),
+        ("Category", record.category),
+        ("Color", record.colour),
+        ("IsActive", record.is_enabled),
+        ("IsCorrespondenceType", record.enable_correspondence),
+        ("Order", record.order),
+        ("Prefix", record.prefix),
+        ("StagesJson", stages_json)
+    ])
+
+def export_record_types(selected_types: List[str] = None) -> Iterator[bytes]:
     """
     Export record types in a format compatible with Azure Table Storage.
     Args:
         selected_types: Optional list of record type names to export. If None, exports all.
-    Returns the filename of the exported JSON file.
+    Yields the UTF-8 encoded JSON document in chunks of EXPORT_CHUNK_SIZE
+    records, byte-for-byte what json.dump(..., indent=2) would write. Nothing
+    is written to disk, so concurrent exports cannot interfere.
     """
-    if selected_types:
-        record_types = RecordType.objects.filter(name__in=selected_types)
-    else:
-        record_types = RecordType.objects.all()
-        
-    export_data = []
-
-    for record in record_types:
-        # Convert stages to StagesJson format
-        stages_json = json.dumps([{
-            "Name": stage.name,
-            "Order": stage.order
-        } for stage in record.stages.all().order_by('order')])
-
-        # Use OrderedDict to maintain field order
-        record_data = OrderedDict([
-            ("odata.type", "briefconnectabcsa.RecordTypes"),
-            ("odata.id", f"https://briefconnectabcsa.table.core.windows.net/RecordTypes(PartitionKey='V1',RowKey='{record.name}')"),
-            ("odata.editLink", f"RecordTypes(PartitionKey='V1',RowKey='{record.name}')"),
-            ("PartitionKey", "V1"),
-            ("RowKey", f"{record.name} ({record.prefix})"),
-            ("Category", record.category),
-            ("Color", record.colour),
-            ("IsActive", record.is_enabled),
-            ("IsCorrespondenceType", record.enable_correspondence),
-            ("Order", record.order),
-            ("Prefix", record.prefix),
-            ("StagesJson", stages_json)
-        ])
-        
-        export_data.append(record_data)
-
-    # Write to file
-    output_file = 'record_types_export.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(export_data, f, cls=DjangoJSONEncoder, indent=2)
+    chunk = []
+    separator = '[\n'
+    for record in record_types_for_export(selected_types):
+        record_json = json.dumps(record_type_export_row(record), cls=DjangoJSONEncoder, indent=2)
+        # Nest the object one level in, as it sits inside the array
+        chunk.append(separator + '  ' + record_json.replace('\n', '\n  '))
+        separator = ',\n'
+        if len(chunk) >= EXPORT_CHUNK_SIZE:
+            yield ''.join(chunk).encode('utf-8')
+            chunk = []
 
-    return output_file
+    # An empty export is written as json.dump writes an empty list
+    chunk.append('[]' if separator == '[\n' else '\n]')
+    yield ''.join(chunk).encode('utf-8')
 
 def export_record_fields(record_type_obj, custom_fields, roles, core_fields):
     """Export record fields to JSON format"""
-    export_data = []
-    
+    return list(iter_record_fields_export(record_type_obj, custom_fields, roles, core_fields))
+
+def iter_record_fields_export(record_type_obj, custom_fields, roles, core_fields):
+    """
+    Yield record fields in export format: core fields, then custom fields,
+    then roles. Each iterable is only read once its turn comes, so lazy
+    querysets stream. roles must come with their stage
+    (select_related('stage')) to avoid a query per role.
+    """
     # Handle core fields
     for field in core_fields:
         # Map field types according to VALID_FIELD_TYPES
@@ -99,7 +167,7 @@ def export_record_fields(record_type_obj, custom_fields, roles, core_fields):
         elif field.name == 'ABCDecisionCategory':
             field_data["DataSourceName"] = "Decision Category"
             
-        export_data.append(field_data)
+        yield field_data
     
     # Handle custom fields
     for field in custom_fields:
@@ -120,7 +188,7 @@ def export_record_fields(record_type_obj, custom_fields, roles, core_fields):
             "DataSourceName": field.term_set or "",
             "SysCategory": "custom"
         }
-        export_data.append(field_data)
+        yield field_data
     
     # Handle roles
     for role in roles:
@@ -143,10 +211,146 @@ def export_record_fields(record_type_obj, custom_fields, roles, core_fields):
             "ShowInHeader": False,
             "Stages": role.stage.name
         }
-        export_data.append(field_data)
-    
-    return export_data
+        yield field_data
+
+RECORD_TYPES_EXPORT_COLUMNS = [
+    'PartitionKey', 'RowKey', 'Category', 'Color', 'IsActive',
+    'IsCorrespondenceType', 'Order', 'Prefix', 'StagesJson'
+]
+
+RECORD_FIELDS_EXPORT_COLUMNS = [
+    'PartitionKey', 'RowKey', 'DisplayName', 'Description', 'FieldType',
+    'FiledType', 'IsActive', 'IsRequired', 'IsNotRequiredOnCreation',
+    'NotEditable', 'Order', 'ShowInHeader', 'WizardPosition',
+    'DataSourceName', 'Stages', 'SysCategory'
+]
+
+def iter_record_types_csv(selected_types: List[str] = None) -> Iterator[str]:
+    """
+    Yield the record type CSV export a line at a time, from the same two
+    queries as the JSON export however many record types there are.
+    """
+    writer = csv.writer(EchoBuffer())
+    yield writer.writerow(RECORD_TYPES_EXPORT_COLUMNS)
+    for record in record_types_for_export(selected_types):
+        row = record_type_export_row(record)
+        yield writer.writerow([row[column] for column in RECORD_TYPES_EXPORT_COLUMNS])
+
+def record_field_csv_row(field, record_type_obj) -> List[Any]:
+    """A field export row as a CSV row of RECORD_FIELDS_EXPORT_COLUMNS."""
+    row = [field.get(column, '') for column in RECORD_FIELDS_EXPORT_COLUMNS]
+    # The CSV names the record type with its prefix, as RecordTypes rows do
+    row[0] = f"{field.get('PartitionKey', '')} ({record_type_obj.prefix})"
+    return row
+
+def iter_record_fields_csv(record_type_obj) -> Iterator[str]:
+    """Yield a RecordType's fields CSV export a line at a time, streamed from lazy querysets."""
+    writer = csv.writer(EchoBuffer())
+    yield writer.writerow(RECORD_FIELDS_EXPORT_COLUMNS)
+    for field in iter_record_type_fields(record_type_obj):
+        yield writer.writerow(record_field_csv_row(field, record_type_obj))
+
+def record_fields_export_filename(record_type_name, extension):
+    """Download name of a RecordType's fields export, e.g. 'my_type_fields.csv'."""
+    return f"{record_type_name.lower().replace(' ', '_')}_fields.{extension}"
+
+def iter_bulk_fields_csv(selected_types: List[str] = None) -> Iterator[str]:
+    """
+    Yield the fields of every (or every selected) RecordType as one CSV, a
+    line at a time. Built from record_types_with_fields: four queries in all.
+    """
+    writer = csv.writer(EchoBuffer())
+    yield writer.writerow(RECORD_FIELDS_EXPORT_COLUMNS)
+    for record_type_obj in record_types_with_fields(selected_types):
+        for field in export_record_type_fields(record_type_obj):
+            yield writer.writerow(record_field_csv_row(field, record_type_obj))
+
+def iter_bulk_fields_ndjson(selected_types: List[str] = None) -> Iterator[str]:
+    """
+    Yield the fields of every (or every selected) RecordType as NDJSON: one
+    field export object per line. Four queries in all.
+    """
+    for record_type_obj in record_types_with_fields(selected_types):
+        for field in export_record_type_fields(record_type_obj):
+            yield json.dumps(field, cls=DjangoJSONEncoder) + '\n'
+
+class ZipChunkBuffer:
+    """
+    Write-only, unseekable file object for zipfile that collects what is
+    written until take() hands it on, so an archive can be streamed out.
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+def iter_bulk_fields_zip(selected_types: List[str] = None) -> Iterator[bytes]:
+    """
+    Yield a zip archive holding one fields CSV per RecordType, each named as
+    its single-type export. The archive is streamed out as each member is
+    written; four queries in all.
+    """
+    buffer = ZipChunkBuffer()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for record_type_obj in record_types_with_fields(selected_types):
+            member = archive.open(record_fields_export_filename(record_type_obj.name, 'csv'), 'w')
+            # Closing the text wrapper flushes it and closes the member
+            with io.TextIOWrapper(member, encoding='utf-8', newline='') as member_text:
+                writer = csv.writer(member_text)
+                writer.writerow(RECORD_FIELDS_EXPORT_COLUMNS)
+                for field in export_record_type_fields(record_type_obj):
+                    writer.writerow(record_field_csv_row(field, record_type_obj))
+            yield buffer.take()
+    # The central directory is written when the archive closes
+    yield buffer.take()
+
+def iter_cached_export(cache_key, make_chunks):
+    """
+    Yield an export's chunks from the cache, or from make_chunks() while
+    storing them for next time. Keys must include the configuration version,
+    so entries never need invalidating. Exports over EXPORT_CACHE_MAX_BYTES
+    stream through without being kept; cache failures never fail the export.
+    """
+    cache = caches[EXPORT_CACHE_ALIAS]
+    cache_key = f"export:{EXPORT_FORMAT_VERSION}:{cache_key}"
+    try:
+        cached = cache.get(cache_key)
+    except Exception as e:
+        logger.warning(f"Export cache read failed: {str(e)}")
+        cached = None
+    if cached is not None:
+        logger.info(f"Serving export from cache: {cache_key}")
+        yield from cached
+        return
+
+    chunks = []
+    size = 0
+    for chunk in make_chunks():
+        if chunks is not None:
+            size += len(chunk)
+            if size > EXPORT_CACHE_MAX_BYTES:
+                chunks = None
+            else:
+                chunks.append(chunk)
+        yield chunk
+
+    if chunks is not None:
+        try:
+            cache.set(cache_key, chunks)
+        except Exception as e:
+            logger.warning(f"Export cache write failed: {str(e)}")
 
 if __name__ == "__main__":
-    filename = export_record_types()
-    print(f"Record types exported to {filename}")
+    for chunk in export_record_types():
+        sys.stdout.buffer.write(chunk)
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.7 on 2026-10-17 15:53
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0027_alter_corefield_field_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ValidationJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('record_types_file', models.CharField(max_length=255)),
+                ('record_fields_file', models.CharField(max_length=255)),
+                ('stage', models.CharField(blank=True, max_length=50)),
+                ('processed', models.IntegerField(default=0)),
+                ('total', models.IntegerField(default=0)),
+                ('success', models.BooleanField(null=True)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ValidationJobResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(choices=[('types', 'Record Types'), ('fields', 'Record Fields')], max_length=10)),
+                ('sequence', models.IntegerField()),
+                ('results_json', models.TextField()),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='result_chunks', to='app.validationjob')),
+            ],
+            options={
+                'ordering': ['section', 'sequence'],
+                'unique_together': {('job', 'section', 'sequence')},
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0028_validationjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='validationjob',
+            name='summary_json',
+            field=models.TextField(blank=True),
+        ),
+        migrations.CreateModel(
+            name='ValidationJobIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(choices=[('types', 'Record Types'), ('fields', 'Record Fields')], max_length=10)),
+                ('facet', models.CharField(choices=[('status', 'Status'), ('partition_key', 'PartitionKey'), ('rule', 'Rule')], max_length=20)),
+                ('value', models.CharField(max_length=255)),
+                ('positions_json', models.TextField()),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='result_index', to='app.validationjob')),
+            ],
+            options={
+                'ordering': ['section', 'facet', 'value'],
+                'unique_together': {('job', 'section', 'facet', 'value')},
+            },
+        ),
+    ]
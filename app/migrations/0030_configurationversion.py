@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-17 21:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0029_validationjob_summary_json_validationjobindex'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConfigurationVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=50, unique=True)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('modified_at', models.DateTimeField(null=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-17 17:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0030_configurationversion'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='validationjobindex',
+            options={'ordering': ['section', 'facet', 'value', 'sequence']},
+        ),
+        migrations.AlterUniqueTogether(
+            name='validationjobindex',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='validationjobindex',
+            name='sequence',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AlterUniqueTogether(
+            name='validationjobindex',
+            unique_together={('job', 'section', 'facet', 'value', 'sequence')},
+        ),
+    ]
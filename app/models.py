@@ -1,3 +1,4 @@
+import uuid
 from django.db import models
 from django.core.validators import MaxLengthValidator, RegexValidator
 from django.core.exceptions import ValidationError
@@ -207,3 +208,82 @@ class Role(models.Model):
     
     def __str__(self):
         return f"{self.name} - {self.stage.name} - {self.record_type.name}"
+
+class ConfigurationVersion(models.Model):
+    """
+    Write counter for the configuration, bumped by the save and delete hooks
+    in config_version.py: one row for the whole configuration and one per
+    record type, keyed by scope.
+    """
+    scope = models.CharField(max_length=50, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    modified_at = models.DateTimeField(null=True)
+
+    def __str__(self):
+        return f"{self.scope} v{self.version}"
+
+class ValidationJob(models.Model):
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    record_types_file = models.CharField(max_length=255)
+    record_fields_file = models.CharField(max_length=255)
+    stage = models.CharField(max_length=50, blank=True)
+    processed = models.IntegerField(default=0)
+    total = models.IntegerField(default=0)
+    success = models.BooleanField(null=True)
+    error = models.TextField(blank=True)
+    summary_json = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Validation job {self.id} ({self.status})"
+
+class ValidationJobResult(models.Model):
+    SECTION_CHOICES = [
+        ('types', 'Record Types'),
+        ('fields', 'Record Fields'),
+    ]
+
+    job = models.ForeignKey(ValidationJob, on_delete=models.CASCADE, related_name='result_chunks')
+    section = models.CharField(max_length=10, choices=SECTION_CHOICES)
+    sequence = models.IntegerField()
+    results_json = models.TextField()
+
+    class Meta:
+        ordering = ['section', 'sequence']
+        unique_together = ('job', 'section', 'sequence')
+
+    def __str__(self):
+        return f"{self.job_id} - {self.section} #{self.sequence}"
+
+class ValidationJobIndex(models.Model):
+    FACET_CHOICES = [
+        ('status', 'Status'),
+        ('partition_key', 'PartitionKey'),
+        ('rule', 'Rule'),
+    ]
+
+    job = models.ForeignKey(ValidationJob, on_delete=models.CASCADE, related_name='result_index')
+    section = models.CharField(max_length=10, choices=ValidationJobResult.SECTION_CHOICES)
+    facet = models.CharField(max_length=20, choices=FACET_CHOICES)
+    value = models.CharField(max_length=255)
+    sequence = models.IntegerField(default=0)
+    positions_json = models.TextField()
+
+    class Meta:
+        ordering = ['section', 'facet', 'value', 'sequence']
+        unique_together = ('job', 'section', 'facet', 'value', 'sequence')
+
+    def __str__(self):
+        return f"{self.job_id} - {self.section} {self.facet}={self.value} #{self.sequence}"
@@ -87,6 +87,24 @@ DATABASES = {
 
 AZURE_STORAGE_CONNECTION_STRING = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
 
+# Validation: set above 1 to validate record fields across a process pool
+VALIDATION_WORKERS = int(os.getenv('VALIDATION_WORKERS', '1'))
+
+# Fraction of record field rows whose rule-by-rule progress is logged; 0 disables it
+VALIDATION_LOG_SAMPLE_RATE = float(os.getenv('VALIDATION_LOG_SAMPLE_RATE', '0.001'))
+
+# Background validation jobs run in a thread pool inside each gunicorn worker
+VALIDATION_JOB_WORKERS = int(os.getenv('VALIDATION_JOB_WORKERS', '2'))
+VALIDATION_JOB_DIR = os.path.join(os.getenv('RAILWAY_VOLUME_MOUNT_PATH', str(BASE_DIR)), 'validation_jobs')
+# Queued or running jobs with no progress for this many minutes lost their worker and are marked failed
+VALIDATION_JOB_STALE_MINUTES = int(os.getenv('VALIDATION_JOB_STALE_MINUTES', '30'))
+
+# Stored validation runs (paged results pages) are deleted after this many hours
+VALIDATION_RUN_MAX_AGE_HOURS = int(os.getenv('VALIDATION_RUN_MAX_AGE_HOURS', '24'))
+
+# Uploads with more Record Fields rows than this are validated as a background job
+VALIDATION_SYNC_MAX_ROWS = int(os.getenv('VALIDATION_SYNC_MAX_ROWS', '20000'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -129,6 +147,32 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cache configuration
+# Validation results are cached on disk so every gunicorn worker shares them
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'validation': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(os.getenv('RAILWAY_VOLUME_MOUNT_PATH', str(BASE_DIR)), 'validation_cache'),
+        'TIMEOUT': 60 * 60 * 24,
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('VALIDATION_CACHE_MAX_ENTRIES', '50')),
+            'CULL_FREQUENCY': 3,
+        },
+    },
+    # Generated exports, keyed by configuration version so they never go stale;
+    # at most MAX_ENTRIES x EXPORT_CACHE_MAX_BYTES (16 MB by default) per worker
+    'exports': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'TIMEOUT': 60 * 60 * 24,
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('EXPORT_CACHE_MAX_ENTRIES', '8')),
+        },
+    },
+}
+
 # Session configuration
 SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
 SESSION_CACHE_ALIAS = 'default'
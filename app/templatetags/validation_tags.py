@@ -4,40 +4,12 @@ from app.utils.constants import CORE_FIELDS
 register = template.Library()
 
 @register.filter
-def get_validation_stats(results):
+def partition_stats(stats, partition_key):
     """
-    Calculate validation statistics from results list
+    Look up the counts the validator recorded for one PartitionKey group,
+    from a ValidationStats or a results list carrying one
     """
-    stats = {
-        'success': 0,
-        'failed': 0,
-        'error': 0,
-        'info': 0,
-        'warning': 0
-    }
-    
-    for result in results:
-        status = result.get('status', '').upper()
-        if status == 'SUCCESS':
-            stats['success'] += 1
-        elif status == 'FAILED':
-            stats['failed'] += 1
-        elif status == 'ERROR':
-            stats['error'] += 1
-        elif status == 'INFO':
-            stats['info'] += 1
-        elif status == 'WARNING':
-            stats['warning'] += 1
-            
-        # Also check details for additional statuses
-        for detail in result.get('details', []):
-            detail_status = detail.get('status', '').upper()
-            if detail_status == 'WARNING':
-                stats['warning'] += 1
-            elif detail_status == 'INFO':
-                stats['info'] += 1
-    
-    return stats 
+    return getattr(stats, 'stats', stats).by_partition.get(partition_key)
 
 @register.filter 
 def is_core_field(field_name):
@@ -0,0 +1,356 @@
+import json
+import os
+import tempfile
+import zipfile
+from datetime import timedelta
+from io import BytesIO
+from unittest import mock
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from .models import RecordType, Stage, CoreField, CustomField, Role, ValidationJob, ConfigurationVersion
+from .export import EXPORT_CACHE_ALIAS
+from .utils.constants import VALIDATION_JOB_CHUNK_SIZE
+from .utils.record_field_validator import validate_record_field_rows
+from .utils.record_type_catalog import RecordTypeCatalog
+from . import settings, validation_jobs
+from .config_version import GLOBAL_SCOPE, configuration_version, record_type_scope
+
+
+class ExportQueryCountTests(TestCase):
+    """Exports are built from a fixed number of queries, however many record types there are"""
+
+    SIZES = (10, 100, 1000)
+
+    def create_record_types(self, count):
+        """Top the configuration up to count record types, each with a stage, core field, custom field and role"""
+        start = RecordType.objects.count()
+        record_types = RecordType.objects.bulk_create([
+            RecordType(name=f"Type {i}", prefix=f"{i:04d}", category='Test', order=i)
+            for i in range(start, count)
+        ])
+        stages = Stage.objects.bulk_create([
+            Stage(record_type=record_type, name='Open', order=1) for record_type in record_types
+        ])
+        CoreField.objects.bulk_create([
+            CoreField(record_type=record_type, name='ABCTitle', display_name='Title', field_type=1)
+            for record_type in record_types
+        ])
+        CustomField.objects.bulk_create([
+            CustomField(record_type=record_type, name='Notes', display_name='Notes', field_type=1)
+            for record_type in record_types
+        ])
+        Role.objects.bulk_create([
+            Role(record_type=record_type, stage=stage, name='ABCInitiator', display_name='Initiator')
+            for record_type, stage in zip(record_types, stages)
+        ])
+
+    def get_export(self, url, num_queries):
+        """Fetch an export, reading the whole (possibly streamed) body inside the query budget"""
+        # bulk_create skips the version hooks, so a cached payload could hide the queries
+        caches[EXPORT_CACHE_ALIAS].clear()
+        with self.assertNumQueries(num_queries):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            if response.streaming:
+                return b''.join(response.streaming_content)
+            return response.content
+
+    def test_export_query_counts_are_constant(self):
+        record_types_url = reverse('export_record_types')
+        bulk_url = reverse('export_all_fields')
+        for size in self.SIZES:
+            self.create_record_types(size)
+            with self.subTest(size=size, export='record types JSON'):
+                content = self.get_export(f"{record_types_url}?format=json", 3)
+                self.assertEqual(len(json.loads(content)), size)
+            with self.subTest(size=size, export='record types CSV'):
+                content = self.get_export(f"{record_types_url}?format=csv", 3)
+                self.assertEqual(len(content.decode('utf-8').splitlines()), size + 1)
+            with self.subTest(size=size, export='bulk fields CSV'):
+                content = self.get_export(f"{bulk_url}?format=csv", 5)
+                self.assertEqual(len(content.decode('utf-8').splitlines()), 3 * size + 1)
+            with self.subTest(size=size, export='bulk fields NDJSON'):
+                content = self.get_export(f"{bulk_url}?format=ndjson", 5)
+                self.assertEqual(len(content.decode('utf-8').splitlines()), 3 * size)
+            with self.subTest(size=size, export='bulk fields zip'):
+                self.get_export(f"{bulk_url}?format=zip", 5)
+
+
+class ExportConditionalGetTests(TestCase):
+    """Export ETags differ per format and selection, and unknown record types are a 404 first"""
+
+    def setUp(self):
+        caches[EXPORT_CACHE_ALIAS].clear()
+        RecordType.objects.create(name='Case', prefix='CA', category='Test', order=1)
+        RecordType.objects.create(name='Task', prefix='TA', category='Test', order=2)
+
+    def test_etag_depends_on_format_and_selection(self):
+        url = reverse('export_all_fields')
+        zip_etag = self.client.get(f"{url}?format=zip")['ETag']
+        response = self.client.get(f"{url}?format=csv", HTTP_IF_NONE_MATCH=zip_etag)
+        self.assertEqual(response.status_code, 200)
+
+        url = reverse('export_record_types')
+        etag = self.client.get(f"{url}?types[]=Case")['ETag']
+        self.assertNotEqual(self.client.get(f"{url}?types[]=Task")['ETag'], etag)
+        self.assertEqual(self.client.get(f"{url}?types[]=Case", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_extra_query_parameters_share_one_cache_entry(self):
+        url = reverse('export_all_fields')
+        for junk in range(5):
+            response = self.client.get(f"{url}?format=csv&junk={junk}")
+            b''.join(response.streaming_content)
+        self.assertEqual(len(caches[EXPORT_CACHE_ALIAS]._cache), 1)
+
+    def test_unknown_record_type_is_a_404_before_the_etag_check(self):
+        # '*' matches any current ETag, so it would get a 304 if one were computed
+        response = self.client.get(reverse('export_fields', args=['Missing']), HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, 404)
+
+
+class ValidationUploadMixin:
+    """A small upload pair, posted to test_validation as CSV or JSON"""
+
+    RECORD_TYPES = [{'RowKey': 'Case', 'Prefix': 'CA', 'Category': 'Test', 'Order': 1, 'StagesJson': '[]'}]
+    # Rows 1 and 2 are dropped by the CSV reader; rows 3 and 4 collide
+    RECORD_FIELDS = [
+        {'PartitionKey': 'Case', 'RowKey': 'Title_0', 'DisplayName': 'Title', 'FieldType': 1},
+        {'PartitionKey': 'Case', 'RowKey': '', 'DisplayName': '', 'FieldType': 1},
+        {'PartitionKey': 'Case', 'RowKey': 'Title', 'DisplayName': 'Title', 'FieldType': 1},
+        {'PartitionKey': 'Case', 'RowKey': 'Title', 'DisplayName': 'Title', 'FieldType': 1},
+    ]
+
+    def upload(self, name, rows):
+        if name.endswith('.json'):
+            return SimpleUploadedFile(name, json.dumps(rows).encode('utf-8'))
+        columns = list(rows[0])
+        lines = [';'.join(columns)] + [';'.join(str(row[column]) for column in columns) for row in rows]
+        return SimpleUploadedFile(name, '\n'.join(lines).encode('utf-8'))
+
+    def validate_upload(self, extension):
+        """Post the pair uncached and return the stored run"""
+        caches['validation'].clear()
+        self.client.post(reverse('test_validation'), {
+            'record_types_file': self.upload(f"types.{extension}", self.RECORD_TYPES),
+            'record_fields_file': self.upload(f"fields.{extension}", self.RECORD_FIELDS),
+        })
+        return ValidationJob.objects.latest('created_at')
+
+
+class DuplicateRowNumberTests(ValidationUploadMixin, TestCase):
+    """Duplicate keys are reported by their row in the uploaded file, whatever its format"""
+
+    def duplicate_messages(self, extension):
+        job = self.validate_upload(extension)
+        return [
+            detail['message']
+            for result in validation_jobs.load_results_page(job, 'fields', {}, 1)
+            for detail in result['details']
+            if detail['field'] == 'Unique Key' and detail['status'] == 'FAILED'
+        ]
+
+    def test_large_uploads_are_validated_in_the_background(self):
+        caches['validation'].clear()
+        job = ValidationJob.objects.create(record_types_file='types.csv', record_fields_file='fields.csv')
+        with mock.patch.object(settings, 'VALIDATION_SYNC_MAX_ROWS', len(self.RECORD_FIELDS) - 1), \
+                mock.patch.object(validation_jobs, 'submit_validation_job', return_value=job) as submit:
+            # The re-upload is served the same job from the cache
+            for _ in range(2):
+                response = self.client.post(reverse('test_validation'), {
+                    'record_types_file': self.upload('types.csv', self.RECORD_TYPES),
+                    'record_fields_file': self.upload('fields.csv', self.RECORD_FIELDS),
+                })
+                self.assertRedirects(response, reverse('validation_job_results', args=[job.pk]), fetch_redirect_response=False)
+        submit.assert_called_once()
+        self.assertEqual(sum(len(rows) for rows in submit.call_args.kwargs['key_index'].values()), len(self.RECORD_FIELDS))
+        self.assertFalse(job.result_chunks.exists())
+
+    def test_job_api_reuses_the_job_of_an_identical_upload(self):
+        caches['validation'].clear()
+        job = ValidationJob.objects.create(record_types_file='types.csv', record_fields_file='fields.csv')
+        with mock.patch.object(validation_jobs, 'submit_validation_job', return_value=job) as submit:
+            for _ in range(2):
+                response = self.client.post(reverse('submit_validation_job'), {
+                    'record_types_file': self.upload('types.csv', self.RECORD_TYPES),
+                    'record_fields_file': self.upload('fields.csv', self.RECORD_FIELDS),
+                })
+                self.assertEqual(response.json()['job_id'], str(job.pk))
+        submit.assert_called_once()
+
+    def test_csv_and_json_report_source_rows(self):
+        for extension in ('csv', 'json'):
+            with self.subTest(extension=extension):
+                messages = self.duplicate_messages(extension)
+                self.assertEqual(len(messages), 2)
+                for message in messages:
+                    self.assertIn('(rows 3, 4)', message)
+
+
+class ConfigurationVersionTests(TestCase):
+    """The version hooks count each write once and leave the cascade delete fast"""
+
+    def create_record_type(self):
+        record_type = RecordType.objects.create(name='Case', prefix='CA', category='Test', order=1)
+        stage = Stage.objects.create(record_type=record_type, name='Open', order=1)
+        CoreField.objects.create(record_type=record_type, name='ABCTitle', display_name='Title', field_type=1)
+        CustomField.objects.create(record_type=record_type, name='Notes', display_name='Notes', field_type=1)
+        Role.objects.create(record_type=record_type, stage=stage, name='ABCInitiator', display_name='Initiator')
+        return record_type
+
+    def test_writes_bump_global_and_record_type_versions(self):
+        record_type = self.create_record_type()
+        self.assertEqual(configuration_version()[0], 5)
+        self.assertEqual(configuration_version(record_type.pk)[0], 5)
+
+    def test_record_type_delete_cascades_fast_and_drops_its_scope(self):
+        record_type = self.create_record_type()
+        global_version = configuration_version()[0]
+        # Stage lookup, four part deletes, the record type, one bump, the scope row
+        with self.assertNumQueries(9):
+            record_type.delete()
+        self.assertEqual(configuration_version()[0], global_version + 1)
+        self.assertFalse(ConfigurationVersion.objects.filter(scope=record_type_scope(record_type.pk)).exists())
+        self.assertTrue(ConfigurationVersion.objects.filter(scope=GLOBAL_SCOPE).exists())
+
+
+class StaleValidationJobTests(TestCase):
+    """Jobs whose worker died are failed, then pruned with their uploads"""
+
+    def setUp(self):
+        job_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(job_dir.cleanup)
+        job_dir_setting = override_settings(VALIDATION_JOB_DIR=job_dir.name)
+        job_dir_setting.enable()
+        self.addCleanup(job_dir_setting.disable)
+
+    def create_job(self, status, age):
+        job = ValidationJob.objects.create(record_types_file='types.csv', record_fields_file='fields.csv', status=status)
+        # A queryset update keeps auto_now from resetting the timestamps
+        then = timezone.now() - age
+        ValidationJob.objects.filter(pk=job.pk).update(created_at=then, updated_at=then)
+        os.makedirs(validation_jobs.get_job_directory(job.pk))
+        return job
+
+    def test_status_poll_fails_jobs_without_progress(self):
+        stale = self.create_job('running', timedelta(hours=1))
+        active = self.create_job('running', timedelta(minutes=1))
+        response = self.client.get(reverse('validation_job_status', args=[stale.pk]))
+        self.assertEqual(response.json()['status'], 'failed')
+        self.assertFalse(os.path.exists(validation_jobs.get_job_directory(stale.pk)))
+        active.refresh_from_db()
+        self.assertEqual(active.status, 'running')
+        self.assertTrue(os.path.exists(validation_jobs.get_job_directory(active.pk)))
+
+    def test_prune_deletes_expired_stale_jobs_and_directories(self):
+        job = self.create_job('queued', timedelta(days=2))
+        validation_jobs.prune_validation_runs()
+        self.assertFalse(ValidationJob.objects.filter(pk=job.pk).exists())
+        self.assertFalse(os.path.exists(validation_jobs.get_job_directory(job.pk)))
+
+
+class ZipUploadTests(TestCase):
+    """A zip uploaded alone has to hold both files; one filling a single slot may hold just its own"""
+
+    RECORD_TYPES = ValidationUploadMixin.RECORD_TYPES
+    RECORD_FIELDS = ValidationUploadMixin.RECORD_FIELDS[2:3]
+
+    def zip_upload(self, name, members):
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as archive:
+            for member_name, rows in members.items():
+                archive.writestr(member_name, json.dumps(rows))
+        return SimpleUploadedFile(name, buffer.getvalue())
+
+    def test_lone_zip_without_record_types_is_rejected(self):
+        upload = self.zip_upload('export.zip', {'RecordFields.json': self.RECORD_FIELDS})
+        response = self.client.post(reverse('test_validation'), {'record_fields_file': upload})
+        self.assertContains(response, 'Could not find a single RecordTypes file in the zip archive')
+        self.assertFalse(ValidationJob.objects.exists())
+
+        upload = self.zip_upload('export.zip', {'RecordFields.json': self.RECORD_FIELDS})
+        response = self.client.post(reverse('submit_validation_job'), {'record_fields_file': upload})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('RecordTypes', response.json()['error'])
+        self.assertFalse(ValidationJob.objects.exists())
+
+    def test_zip_filling_one_slot_uses_its_only_member(self):
+        caches['validation'].clear()
+        response = self.client.post(reverse('test_validation'), {
+            'record_types_file': SimpleUploadedFile('types.json', json.dumps(self.RECORD_TYPES).encode('utf-8')),
+            'record_fields_file': self.zip_upload('fields.zip', {'export.json': self.RECORD_FIELDS}),
+        })
+        job = ValidationJob.objects.get()
+        self.assertRedirects(response, reverse('validation_job_results', args=[job.pk]), fetch_redirect_response=False)
+        self.assertEqual(job.total, len(self.RECORD_TYPES) + len(self.RECORD_FIELDS))
+
+
+class FilteredResultsPageTests(TestCase):
+    """A filtered page reads its slice of the chunked filter index, not every matching position"""
+
+    def test_filtered_pages_match_and_load_a_fixed_number_of_chunks(self):
+        rows = 3 * VALIDATION_JOB_CHUNK_SIZE
+        fields = [
+            {'PartitionKey': 'Case' if i % 2 else 'Other', 'RowKey': f"ABCField{i}", 'DisplayName': f"Field {i}", 'FieldType': 1}
+            for i in range(rows)
+        ]
+        record_types = RecordTypeCatalog([{'RowKey': 'Case', 'Prefix': 'CA', 'Category': 'Test', 'Order': 1}])
+        _, field_results = validate_record_field_rows(fields, record_types=record_types)
+        job = validation_jobs.store_validation_run('types.json', 'fields.json', [], field_results)
+
+        filters = {'partition_key': 'Other'}
+        first_page = validation_jobs.load_results_page(job, 'fields', filters, 1)
+        self.assertEqual(first_page.paginator.count, rows // 2)
+        # Count, then the index chunks and result chunks of the page
+        with self.assertNumQueries(3):
+            last_page = validation_jobs.load_results_page(job, 'fields', filters, first_page.paginator.num_pages)
+            results = list(last_page)
+        self.assertTrue(results)
+        self.assertEqual({result['partition_key'] for result in results}, {'Other'})
+        self.assertEqual(results[-1]['record'], f"ABCField{rows - 2}")
+
+
+class StoredResultShapeTests(ValidationUploadMixin, TestCase):
+    """Record Types results are stored and reported without the per-row stats the templates use"""
+
+    def test_stats_are_not_stored_or_reported(self):
+        job = self.validate_upload('json')
+        for chunk in job.result_chunks.all():
+            for result in json.loads(chunk.results_json):
+                self.assertNotIn('stats', result)
+
+        response = self.client.get(reverse('validation_job_report', args=[job.pk, 'ndjson']))
+        lines = [json.loads(line) for line in b''.join(response.streaming_content).decode('utf-8').splitlines()]
+        self.assertEqual({line['section'] for line in lines}, {'Record Types', 'Record Fields'})
+        for line in lines:
+            self.assertNotIn('stats', line)
+
+        # The results page still counts each row's details
+        page = validation_jobs.load_results_page(job, 'types', {}, 1)
+        self.assertIsNotNone(page[0]['stats'])
+
+
+class ResultMessageEscapingTests(ValidationUploadMixin, TestCase):
+    """Uploaded values quoted in check messages are escaped on the results pages"""
+
+    PAYLOAD = '<script>alert(1)</script>'
+    RECORD_FIELDS = [{'PartitionKey': PAYLOAD, 'RowKey': 'Title', 'DisplayName': 'Title', 'FieldType': 1}]
+
+    def assertEscaped(self, content):
+        self.assertNotIn(self.PAYLOAD, content)
+        self.assertIn('&lt;script&gt;alert(1)&lt;/script&gt;', content)
+
+    def test_streamed_results_escape_messages(self):
+        response = self.client.post(reverse('test_validation'), {
+            'record_types_file': self.upload('types.json', self.RECORD_TYPES),
+            'record_fields_file': self.upload('fields.json', self.RECORD_FIELDS),
+            'stream': 'on',
+        })
+        self.assertEscaped(b''.join(response.streaming_content).decode('utf-8'))
+
+    def test_stored_results_escape_messages(self):
+        job = self.validate_upload('json')
+        response = self.client.get(reverse('validation_job_results', args=[job.pk]))
+        self.assertEscaped(response.content.decode('utf-8'))
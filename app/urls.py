@@ -35,8 +35,14 @@ urlpatterns = [
     path('record/<str:record_type>/', views.record_fields, name='record_fields'),
     path('export/record-types/', views.export_record_types, name='export_record_types'),
     path('record-type/<str:record_type>/export-fields/', views.export_fields, name='export_fields'),
+    path('export/record-fields/', views.export_all_fields, name='export_all_fields'),
     path('tables/', views.list_tables, name='list_tables'),
     path('tables/<str:table_name>/', views.view_table_data, name='view_table_data'),
     path('tables/<str:table_name>/export/', views.export_table_data, name='export_table_data'),
     path('test-validation/', views.test_validation, name='test_validation'),
+    path('test-validation/current/', views.validate_current_configuration, name='validate_current_configuration'),
+    path('test-validation/jobs/', views.submit_validation_job, name='submit_validation_job'),
+    path('test-validation/jobs/<uuid:job_id>/', views.validation_job_status, name='validation_job_status'),
+    path('test-validation/jobs/<uuid:job_id>/results/', views.validation_job_results, name='validation_job_results'),
+    path('test-validation/jobs/<uuid:job_id>/report/<str:report_format>/', views.validation_job_report, name='validation_job_report'),
 ]
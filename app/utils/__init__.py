@@ -2,4 +2,12 @@ from .record_type_validator import *
 from .record_field_validator import *
 from .stage_validator import *
 from .csv_parser import *
+from .validation_cache import *
+from .upload_reader import *
+from .validation_result import *
+from .validation_stats import *
+from .validation_trace import *
+from .record_type_catalog import *
+from .validation_report import *
+from .ingestion_schema import *
 from .constants import * 
\ No newline at end of file
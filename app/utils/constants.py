@@ -25,6 +25,8 @@ RECORD_FIELD_MAPPING = {
 }
 
 # Validation Constants
+# Bump whenever a validation rule or message changes, so cached results are not reused
+VALIDATION_RULES_VERSION = '8'
 SKIP_VALIDATION_MESSAGE = "Record is inactive (IsActive=False) - skipping validation"
 STAGE_NAME_MAX_LENGTH = 50
 REQUIRED_STAGES = ['Initiate', 'Closed']
@@ -112,4 +114,31 @@ SYSTEM_MANDATORY_FIELDS = {
     'Title',
     'ABCOrgLevel1', 
     'ABCOrgLevel2'
-}
\ No newline at end of file
+}
+
+# Streaming validation
+CSV_SNIFF_SAMPLE_SIZE = 64 * 1024  # Leading bytes read to pick the delimiter
+CSV_DELIMITERS = (';', ',')  # Candidate delimiters, preferred first on a tie
+JSON_READ_CHUNK_SIZE = 64 * 1024  # Characters of a JSON upload decoded per read
+VALIDATION_STREAM_CHUNK_SIZE = 200  # Results rendered per chunk sent to the browser
+
+# Compressed uploads
+UPLOAD_FORMATS = ('csv', 'json')  # Formats the validators read, directly or from an archive
+GZIP_UPLOAD_EXTENSION = 'gz'  # A single gzip-compressed CSV or JSON file (name.csv.gz)
+ZIP_UPLOAD_EXTENSION = 'zip'  # One or both of the RecordTypes and RecordFields files
+
+# Parallel validation
+PARALLEL_VALIDATION_MIN_ROWS = 5000  # Smaller uploads are not worth the process pool start-up cost
+
+# Background validation jobs
+VALIDATION_JOB_CHUNK_SIZE = 500  # Results stored per ValidationJobResult row
+VALIDATION_RESULTS_PAGE_SIZE = 50  # Results per section on each page of a stored run
+
+# Current configuration validation
+CONFIG_VALIDATION_CHUNK_SIZE = 200  # RecordTypes fetched (with their prefetches) per query batch
+
+# Exports
+EXPORT_CHUNK_SIZE = 100  # Records encoded per chunk of a streamed export
+# Bump whenever an export's content or layout changes, so ETags and cached payloads are not reused
+EXPORT_FORMAT_VERSION = '1'
+EXPORT_CACHE_MAX_BYTES = 2 * 1024 * 1024  # Larger exports are streamed without being cached
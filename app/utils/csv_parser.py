@@ -1,64 +1,82 @@
+import codecs
 import csv
+import itertools
 import logging
 import json
-import pandas as pd
-from io import StringIO
+from .constants import CSV_SNIFF_SAMPLE_SIZE, CSV_DELIMITERS
+from .ingestion_schema import coerce_record
 
 logger = logging.getLogger(__name__)
 
+def sniff_csv_delimiter(csv_file, sample_size=CSV_SNIFF_SAMPLE_SIZE):
+    """
+    Pick the delimiter from the header line of a small leading sample: the
+    candidate it contains most often. Header names are unquoted, unlike data
+    rows whose StagesJson is full of commas. Leaves the file at its start.
+    """
+    csv_file.seek(0)
+    sample = csv_file.read(sample_size)
+    csv_file.seek(0)
+    if isinstance(sample, bytes):
+        # The sample may end mid-character
+        sample = sample.decode('utf-8', errors='ignore')
+    lines = sample.lstrip('\ufeff').splitlines()
+    header = lines[0] if lines else ''
+    
+    delimiter = max(CSV_DELIMITERS, key=header.count)
+    if not header.count(delimiter):
+        # A single column: any delimiter parses it the same way
+        delimiter = ','
+    logger.debug(f"Sniffed CSV delimiter {delimiter!r}")
+    return delimiter
+
 def parse_csv_to_json(csv_file, file_type):
     """Parse CSV file to JSON format."""
-    try:
-        # If csv_file is InMemoryUploadedFile, read its content
-        if hasattr(csv_file, 'read'):
-            # Save the current position
-            pos = csv_file.tell()
-            # Reset to beginning of file
-            csv_file.seek(0)
-            # Read the content
-            content = csv_file.read()
-            # Reset position back
-            csv_file.seek(pos)
-            
-            # If content is bytes, decode to string
-            if isinstance(content, bytes):
-                content = content.decode('utf-8')
-                
-            # Create StringIO object from content
-            csv_data = StringIO(content)
-        else:
-            csv_data = csv_file
+    return list(iter_csv_records(csv_file, file_type))
 
-        # Try reading with semicolon first, then comma if that fails
-        try:
-            df = pd.read_csv(csv_data, encoding='utf-8', sep=';')
-        except:
-            # Reset file pointer if needed
-            if hasattr(csv_data, 'seek'):
-                csv_data.seek(0)
-            df = pd.read_csv(csv_data, encoding='utf-8', sep=',')
-        
-        if df.empty:
+def iter_text_lines(csv_file):
+    """Decoded lines of a binary (or text) file from its start, read one line at a time."""
+    csv_file.seek(0)
+    lines = iter(csv_file)
+    first_line = next(lines, None)
+    if first_line is None:
+        return
+    if isinstance(first_line, bytes):
+        # utf-8-sig drops a leading byte order mark
+        yield from codecs.iterdecode(itertools.chain([first_line], lines), 'utf-8-sig')
+    else:
+        yield first_line.lstrip('\ufeff')
+        yield from lines
+
+def iter_csv_records(csv_file, file_type, include_skipped=False):
+    """
+    Lazily parse a CSV file with the stdlib csv module, yielding one record
+    dict at a time. Declared columns are coerced by the ingestion schema;
+    the rest keep the strings in the file, with '' for empty cells.
+    
+    RecordFields rows with an empty or _0 RowKey are dropped unless
+    include_skipped is set, which yields every row in file order so row
+    numbers can be counted from the source.
+    """
+    try:
+        delimiter = sniff_csv_delimiter(csv_file)
+        reader = csv.DictReader(iter_text_lines(csv_file), delimiter=delimiter)
+        if not reader.fieldnames:
             raise ValueError("CSV file is empty")
             
-        logger.info(f"Successfully read CSV with columns: {df.columns.tolist()}")
-        
-        # Convert DataFrame to list of dictionaries
-        records = df.to_dict('records')
-        
-        if file_type == 'record_fields':
-            # Filter out records where RowKey ends with _0
-            records = [record for record in records 
-                      if record.get('RowKey') and 
-                      not str(record['RowKey']).endswith('_0')]
-            logger.info(f"Filtered to {len(records)} records after removing _0 suffix entries")
-            
-        # Convert to JSON format
-        return records
+        logger.info(f"Streaming CSV with columns: {reader.fieldnames}")
         
-    except pd.errors.EmptyDataError:
-        logger.error("CSV file is empty or has no parseable data")
-        raise ValueError("CSV file is empty or has no parseable data")
+        row_count = 0
+        for record in reader:
+            row_count += 1
+            if not include_skipped and file_type == 'record_fields' and (
+                not record.get('RowKey') or str(record['RowKey']).endswith('_0')
+            ):
+                continue
+            yield coerce_record(record, file_type)
+        if not row_count:
+            raise ValueError("CSV file is empty")
+                
     except Exception as e:
         logger.error(f"Error parsing CSV file: {str(e)}")
-        raise ValueError(f"Error parsing CSV file: {str(e)}")
\ No newline at end of file
+        raise ValueError(f"Error parsing CSV file: {str(e)}")
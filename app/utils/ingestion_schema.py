@@ -0,0 +1,73 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+def is_missing_value(value):
+    """Returns True for empty cells: None, '' or NaN."""
+    return value is None or value == '' or str(value).lower() == 'nan'
+
+def coerce_boolean(value):
+    """True only for True or any casing of 'true'; empty cells and anything else are False."""
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() == 'true'
+
+def coerce_integer(value):
+    """
+    int for integral values (3, '3', 3.0, '3.0'), None for empty cells, and
+    the value unchanged otherwise so the rules can report what was uploaded.
+    """
+    if is_missing_value(value):
+        return None
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        pass
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return value
+    return int(number) if number.is_integer() else value
+
+# Declared column types per upload format; undeclared columns are left as parsed
+RECORD_TYPES_SCHEMA = {
+    'IsActive': coerce_boolean,
+    'IsCorrespondenceType': coerce_boolean,
+    'Order': coerce_integer,
+}
+
+RECORD_FIELDS_SCHEMA = {
+    'IsActive': coerce_boolean,
+    'IsRequired': coerce_boolean,
+    'IsNotRequiredOnCreation': coerce_boolean,
+    'NotEditable': coerce_boolean,
+    'ShowInHeader': coerce_boolean,
+    'FieldType': coerce_integer,
+    'FiledType': coerce_integer,
+    'WizardPosition': coerce_integer,
+    'Order': coerce_integer,
+}
+
+INGESTION_SCHEMAS = {
+    'record_types': RECORD_TYPES_SCHEMA,
+    'record_fields': RECORD_FIELDS_SCHEMA,
+}
+
+def coerce_record(record, file_type):
+    """
+    Coerces a record's declared columns in place and returns it. Absent
+    columns stay absent, so the validators' defaults still apply.
+    """
+    for column, coerce in INGESTION_SCHEMAS[file_type].items():
+        if column in record:
+            record[column] = coerce(record[column])
+    return record
+
+def iter_coerced_records(records, file_type):
+    """Coerces records as they are read."""
+    for record in records:
+        yield coerce_record(record, file_type)
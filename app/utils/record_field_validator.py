@@ -1,17 +1,27 @@
 import logging
+import os
 import re
+import time
 from .constants import (
     RECORD_FIELD_MAPPING, 
     VALID_FIELD_TYPES,
     DATASOURCE_REQUIRED_TYPES,
     ROLE_FIELD_TYPES,
-    SKIP_VALIDATION_MESSAGE,
     IGNORED_SP_FIELDS,
     IGNORED_STATE_FIELDS,
     CORE_FIELDS,
-    VALID_WIZARD_POSITIONS
+    VALID_WIZARD_POSITIONS,
+    PARALLEL_VALIDATION_MIN_ROWS
 )
 import json
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from .upload_reader import read_json_records
+from .ingestion_schema import is_missing_value
+from .validation_result import RecordResult, make_check, any_failed, SUCCESS, FAILED, ERROR, INFO
+from .validation_stats import collect_results
+from .validation_trace import ValidationTrace
+from .record_type_catalog import as_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -23,14 +33,38 @@ def map_json_to_record_field(json_data, field_mapping=RECORD_FIELD_MAPPING):
         value = json_data.get(json_field)
         
         if model_field in ['is_active', 'is_mandatory', 'show_in_header']:
-            value = str(value).lower() == 'true' if value else False
+            value = bool(value)
             
         mapped_data[model_field] = value
         
     return mapped_data
 
-def validate_record_field(field_data, record_types, all_fields):
-    """Validates a single record field according to rules."""
+def build_field_key_index(fields):
+    """
+    Index fields by (PartitionKey, RowKey), mapping each key to its row numbers.
+    
+    Rows are numbered from 1 in the order given, so fields must be every row
+    of the source, before any filtering (iter_upload_records with
+    include_skipped), for the numbers to be positions in the uploaded file.
+    """
+    key_index = {}
+    for row_number, field in enumerate(fields, start=1):
+        key = (field.get('PartitionKey', ''), field.get('RowKey'))
+        key_index.setdefault(key, []).append(row_number)
+    return key_index
+
+def validate_record_field(field_data, record_types, all_fields, key_index=None, trace=None):
+    """
+    Validates a single record field according to rules, returning a list of Checks.
+    
+    record_types is a RecordTypeCatalog (or any container of names); role
+    stages are only checked against a catalog. Rule timings are added to
+    trace; only rows in its logging sample log progress.
+    
+    field_data must already be typed by the ingestion schema: booleans are
+    bools, and integer columns hold an int, None when empty, or the uploaded
+    value when it is not an integer.
+    """
     field_name = field_data.get('RowKey', 'Unknown Field')
     
     # Skip fields ending with _0
@@ -43,14 +77,19 @@ def validate_record_field(field_data, record_types, all_fields):
         logger.debug(f"Skipping ignored field {field_name}")
         return None
         
+    if trace is None:
+        trace = ValidationTrace(sample_rate=0)
+    sampled = trace.next_row()
     validation_results = []
+    started = time.perf_counter()
     
     try:
-        logger.info(f"Starting validation for field: {field_name}")
+        if sampled:
+            logger.info("Starting validation for field: %s", field_name)
         
         # Check IsActive status first
-        is_active = str(field_data.get('IsActive', 'true')).lower() == 'true'
-        not_editable = str(field_data.get('NotEditable', 'false')).lower() == 'true'
+        is_active = field_data.get('IsActive', True)
+        not_editable = field_data.get('NotEditable', False)
         field_name = field_data.get('RowKey', 'Unknown Field')
 
         # Special handling for specific core fields
@@ -58,323 +97,346 @@ def validate_record_field(field_data, record_types, all_fields):
 
         if not is_active:
             if field_name in SYSTEM_MANDATORY_FIELDS:
-                validation_results.append({
-                    'field': 'IsActive',
-                    'status': 'INFO',
-                    'message': f"Core field '{field_name}' is marked as inactive but will be shown on UI as it is system mandatory"
-                })
+                validation_results.append(make_check('inactive.system_mandatory', field_name))
             elif field_name in CORE_FIELDS:
                 if not not_editable:
-                    validation_results.append({
-                        'field': 'IsActive',
-                        'status': 'ERROR',
-                        'message': f"Core field '{field_name}' will not be hidden. To hide, set NotEditable to true, or to show, set IsActive to true and NotEditable to false"
-                    })
+                    validation_results.append(make_check('inactive.core_not_hidden', field_name))
                 else:
-                    validation_results.append({
-                        'field': 'IsActive',
-                        'status': 'INFO',
-                        'message': f"Core field '{field_name}' is marked as inactive and not editable"
-                    })
+                    validation_results.append(make_check('inactive.core_not_editable', field_name))
             else:
-                return [{
-                    'field': 'IsActive',
-                    'status': 'INFO',
-                    'message': SKIP_VALIDATION_MESSAGE
-                }]
+                trace.record('IsActive', started)
+                return [make_check('inactive.skipped')]
+        started = trace.record('IsActive', started)
 
         partition_key = field_data.get('PartitionKey', '')
         
         # 1. PartitionKey validation
-        logger.info(f"Validating PartitionKey for {field_name}")
+        if sampled:
+            logger.info("Validating PartitionKey for %s", field_name)
         if not partition_key:
-            validation_results.append({
-                'field': 'PartitionKey',
-                'status': 'FAILED',
-                'message': "PartitionKey is required"
-            })
+            validation_results.append(make_check('partition_key.required'))
         elif partition_key not in record_types:
-            validation_results.append({
-                'field': 'PartitionKey',
-                'status': 'FAILED',
-                'message': f"PartitionKey '{partition_key}' does not match any Record Type"
-            })
+            validation_results.append(make_check('partition_key.unknown', partition_key))
         else:
-            validation_results.append({
-                'field': 'PartitionKey',
-                'status': 'SUCCESS',
-                'message': f"Valid Record Type: {partition_key}"
-            })
+            validation_results.append(make_check('partition_key.valid', partition_key))
+        started = trace.record('PartitionKey', started)
             
         # 2. Unique RowKey + PartitionKey combination
-        logger.info(f"Checking uniqueness for {field_name}")
-        if any(f != field_data and 
-               f.get('PartitionKey') == partition_key and 
-               f.get('RowKey') == field_name 
-               for f in all_fields):
-            validation_results.append({
-                'field': 'Unique Key',
-                'status': 'FAILED',
-                'message': f"Combination of PartitionKey '{partition_key}' and RowKey '{field_name}' is not unique"
-            })
+        if sampled:
+            logger.info("Checking uniqueness for %s", field_name)
+        if key_index is None:
+            key_index = build_field_key_index(all_fields)
+        colliding_rows = key_index.get((partition_key, field_name), [])
+        if len(colliding_rows) > 1:
+            validation_results.append(make_check('unique_key.duplicate', partition_key, field_name, colliding_rows))
         else:
-            validation_results.append({
-                'field': 'Unique Key',
-                'status': 'SUCCESS',
-                'message': "Field key is unique"
-            })
+            validation_results.append(make_check('unique_key.unique'))
+        started = trace.record('Unique Key', started)
             
         # 3. RowKey format validation
-        logger.info(f"Validating RowKey format for {field_name}")
+        if sampled:
+            logger.info("Validating RowKey format for %s", field_name)
         if not re.match(r'^[A-Za-z0-9]+$', field_name):
-            validation_results.append({
-                'field': 'RowKey Format',
-                'status': 'FAILED',
-                'message': "RowKey must contain only alphanumeric characters (no spaces)"
-            })
+            validation_results.append(make_check('row_key.invalid'))
         else:
-            validation_results.append({
-                'field': 'RowKey Format',
-                'status': 'SUCCESS',
-                'message': "RowKey format is valid"
-            })
+            validation_results.append(make_check('row_key.valid'))
+        started = trace.record('RowKey Format', started)
             
         # Get both field type values
         field_type = field_data.get('FieldType')
         filed_type = field_data.get('FiledType')  # Handle legacy typo
         
         # 4. Field Types validation
-        logger.info(f"Validating field types for {field_name}")
+        if sampled:
+            logger.info("Validating field types for %s", field_name)
         if field_type is not None and filed_type is not None:
             if field_type == filed_type:
-                validation_results.append({
-                    'field': 'FiledType',
-                    'status': 'INFO',
-                    'message': f"FiledType present and matches FieldType (value: {field_type})"
-                })
+                validation_results.append(make_check('field_types.match', field_type))
             else:
-                validation_results.append({
-                    'field': 'Field Types',
-                    'status': 'FAILED',
-                    'message': f"FieldType ({field_type}) does not match FiledType ({filed_type})"
-                })
+                validation_results.append(make_check('field_types.mismatch', field_type, filed_type))
         elif filed_type is not None:
-            validation_results.append({
-                'field': 'FiledType',
-                'status': 'INFO',
-                'message': f"FiledType present with value: {filed_type}"
-            })
+            validation_results.append(make_check('field_types.filed_only', filed_type))
+        started = trace.record('Field Types', started)
             
         # 5. DataSourceName validation
-        logger.info(f"Validating DataSourceName for {field_name}")
+        if sampled:
+            logger.info("Validating DataSourceName for %s", field_name)
         datasource_name = field_data.get('DataSourceName')
-        if field_type and int(field_type) in DATASOURCE_REQUIRED_TYPES:
+        field_type_int = field_type if isinstance(field_type, int) else None
+        if field_type_int in DATASOURCE_REQUIRED_TYPES:
             if not datasource_name:
-                validation_results.append({
-                    'field': 'DataSourceName',
-                    'status': 'FAILED',
-                    'message': f"DataSourceName is required for field type {VALID_FIELD_TYPES.get(int(field_type))}"
-                })
+                validation_results.append(make_check('datasource.missing', VALID_FIELD_TYPES.get(field_type_int)))
             else:
-                validation_results.append({
-                    'field': 'DataSourceName',
-                    'status': 'INFO',
-                    'message': f"Term set must exactly match: {datasource_name}"
-                })
+                validation_results.append(make_check('datasource.present', datasource_name))
+        started = trace.record('DataSourceName', started)
                 
         # 6. Display name validation
-        logger.info(f"Validating display name for {field_name}")
+        if sampled:
+            logger.info("Validating display name for %s", field_name)
         display_name = field_data.get('DisplayName')
         if not display_name:
-            validation_results.append({
-                'field': 'Display Name',
-                'status': 'FAILED',
-                'message': "Display name is required"
-            })
+            validation_results.append(make_check('display_name.missing'))
         else:
-            validation_results.append({
-                'field': 'Display Name',
-                'status': 'SUCCESS',
-                'message': "Display name is valid"
-            })
+            validation_results.append(make_check('display_name.valid'))
+        started = trace.record('Display Name', started)
             
         # 7. Field type validation
-        logger.info(f"Validating field type values for {field_name}")
+        if sampled:
+            logger.info("Validating field type values for %s", field_name)
         if field_type is not None:
-            try:
-                field_type_int = int(field_type)
-                if field_type_int not in VALID_FIELD_TYPES:
-                    validation_results.append({
-                        'field': 'FieldType',
-                        'status': 'FAILED',
-                        'message': f"Invalid field type: {field_type}. Must be one of {list(VALID_FIELD_TYPES.keys())}"
-                    })
-                else:
-                    validation_results.append({
-                        'field': 'FieldType',
-                        'status': 'SUCCESS',
-                        'message': f"Valid field type: {VALID_FIELD_TYPES[field_type_int]}"
-                    })
-            except (ValueError, TypeError):
-                validation_results.append({
-                    'field': 'FieldType',
-                    'status': 'FAILED',
-                    'message': "FieldType must be a valid integer"
-                })
+            if field_type_int is None:
+                validation_results.append(make_check('field_type.not_integer'))
+            elif field_type_int not in VALID_FIELD_TYPES:
+                validation_results.append(make_check('field_type.invalid', field_type))
+            else:
+                validation_results.append(make_check('field_type.valid', VALID_FIELD_TYPES[field_type_int]))
+        started = trace.record('FieldType', started)
                 
         # Add WizardPosition validation for non-role fields
         wizard_position = field_data.get('WizardPosition')
-        
-        # Determine if this is a role field
-        is_role_field = False
-        if field_type is not None:
-            try:
-                field_type_int = int(field_type)
-                is_role_field = field_type_int in ROLE_FIELD_TYPES
-            except (ValueError, TypeError):
-                pass
+        is_role_field = field_type_int in ROLE_FIELD_TYPES
         
         if not is_role_field:
             # Validate WizardPosition for non-role fields
-            # Handle empty, None, nan, or missing values
-            if wizard_position is None or wizard_position == '' or str(wizard_position).lower() == 'nan':
-                validation_results.append({
-                    'field': 'WizardPosition',
-                    'status': 'INFO',
-                    'message': "WizardPosition not specified - defaulting to 0 (Record Information page)"
-                })
+            if wizard_position is None:
+                validation_results.append(make_check('wizard.default'))
+            elif not isinstance(wizard_position, int):
+                validation_results.append(make_check('wizard.not_integer', wizard_position))
+            elif wizard_position not in VALID_WIZARD_POSITIONS:
+                validation_results.append(make_check('wizard.invalid', wizard_position))
+            elif wizard_position == 1:
+                validation_results.append(make_check('wizard.response_page'))
             else:
-                try:
-                    wizard_pos_int = int(float(wizard_position))  # Convert through float to handle numeric strings
-                    if wizard_pos_int not in VALID_WIZARD_POSITIONS:
-                        validation_results.append({
-                            'field': 'WizardPosition',
-                            'status': 'FAILED',
-                            'message': f"Invalid WizardPosition value: {wizard_position}. Must be 0 (Record Information) or 1 (Record Response)"
-                        })
-                    else:
-                        page_type = "Record Response page" if wizard_pos_int == 1 else "Record Information page"
-                        validation_results.append({
-                            'field': 'WizardPosition',
-                            'status': 'SUCCESS',
-                            'message': f"Field will appear on {page_type}"
-                        })
-                except (ValueError, TypeError):
-                    validation_results.append({
-                        'field': 'WizardPosition',
-                        'status': 'FAILED',
-                        'message': f"WizardPosition must be a valid integer (0 or 1), got: {wizard_position}"
-                    })
+                validation_results.append(make_check('wizard.information_page'))
         else:
             # Add info message for role fields
-            validation_results.append({
-                'field': 'WizardPosition',
-                'status': 'INFO',
-                'message': "Role field - will appear on People and Roles page"
-            })
+            validation_results.append(make_check('wizard.role_field'))
+        started = trace.record('WizardPosition', started)
+        
+        # 8. Role stage must exist in the record type's StagesJson
+        if is_role_field:
+            stage_names = getattr(record_types, 'stage_names', {}).get(partition_key)
+            stage_name = field_data.get('Stages')
+            if stage_names is not None and not is_missing_value(stage_name):
+                if stage_name in stage_names:
+                    validation_results.append(make_check('role_stage.valid', stage_name, partition_key))
+                else:
+                    validation_results.append(make_check('role_stage.unknown', stage_name, partition_key))
+            trace.record('Stages', started)
         
     except Exception as e:
         logger.error(f"Error validating field {field_name}: {str(e)}")
-        validation_results.append({
-            'field': 'System',
-            'status': 'ERROR',
-            'message': f"Unexpected error: {str(e)}"
-        })
+        validation_results.append(make_check('system.unexpected', str(e)))
         
-    logger.info(f"Completed validation for field: {field_name}")
+    if sampled:
+        logger.info("Completed validation for field: %s", field_name)
     return validation_results
 
-def test_validate_record_fields_from_json(json_file_path, record_types=None, all_fields=None):
-    """Test function to validate RecordFields data from a JSON file."""
-    logger.info(f"Testing RecordFields validation with file: {json_file_path}")
-    validation_results = []
+def is_skipped_field(field):
+    """Returns True for fields that are never validated (_0 suffix, ignored fields)."""
+    row_key = field.get('RowKey', '')
+    return (
+        str(row_key).endswith('_0')
+        or row_key in IGNORED_STATE_FIELDS
+        or row_key in IGNORED_SP_FIELDS
+    )
+
+def iter_validate_record_fields(fields, record_types=None, key_index=None, trace=None):
+    """
+    Validates record fields one at a time, yielding a result entry per field.
     
-    try:
-        # Read JSON file if all_fields not provided
-        if all_fields is None:
-            with open(json_file_path, 'r') as file:
-                all_fields = json.load(file)
-                
-        # Filter out fields ending with _0 and ignored fields
-        filtered_fields = [
-            f for f in all_fields 
-            if not f.get('RowKey', '').endswith('_0') 
-            and f.get('RowKey') not in IGNORED_STATE_FIELDS 
-            and f.get('RowKey') not in IGNORED_SP_FIELDS
-        ]
+    fields may be any iterable when key_index is supplied; otherwise it must be
+    re-iterable so the uniqueness index can be built first. Rule timings are
+    added to trace when one is given.
+    """
+    if key_index is None:
+        key_index = build_field_key_index(fields)
+    record_types = as_catalog(record_types)
         
-        logger.info(f"Filtered out {len(all_fields) - len(filtered_fields)} ignored/system fields")
-                
-        overall_success = True
+    for field in fields:
+        if is_skipped_field(field):
+            continue
             
-        for field in filtered_fields:
-            try:
-                is_active = str(field.get('IsActive', 'true')).lower() == 'true'
-                field_name = field.get('RowKey', 'Unknown Field')
-                display_name = field.get('DisplayName', field_name)  # Get DisplayName, fallback to RowKey
-                
-                # Handle inactive fields
-                if not is_active:
-                    if field_name not in CORE_FIELDS:
-                        validation_results.append({
-                            'record': field_name,
-                            'display_name': display_name,  # Add display name
-                            'record_display_name': display_name or field_name,  # For sorting
-                            'status': 'INFO',
-                            'is_active': is_active,
-                            'partition_key': field.get('PartitionKey', ''),
-                            'details': [{
-                                'field': 'IsActive',
-                                'status': 'INFO',
-                                'message': SKIP_VALIDATION_MESSAGE
-                            }]
-                        })
-                        continue
-                
-                # Proceed with validation for active fields and special core fields
-                field_validations = validate_record_field(
-                    field,
-                    record_types=record_types or [],
-                    all_fields=filtered_fields
+        try:
+            is_active = field.get('IsActive', True)
+            field_name = field.get('RowKey', 'Unknown Field')
+            display_name = field.get('DisplayName', field_name)  # Get DisplayName, fallback to RowKey
+            
+            # Handle inactive fields
+            if not is_active:
+                if field_name not in CORE_FIELDS:
+                    yield RecordResult(
+                        field_name,
+                        display_name,
+                        INFO,
+                        [make_check('inactive.skipped')],
+                        is_active=is_active,
+                        partition_key=field.get('PartitionKey', '')
+                    )
+                    continue
+            
+            # Proceed with validation for active fields and special core fields
+            field_validations = validate_record_field(
+                field,
+                record_types=record_types,
+                all_fields=None,
+                key_index=key_index,
+                trace=trace
+            )
+            
+            if field_validations:  # Only add results if validations were performed
+                yield RecordResult(
+                    field_name,
+                    display_name,
+                    FAILED if any_failed(field_validations) else SUCCESS,
+                    field_validations,
+                    is_active=is_active,
+                    partition_key=field.get('PartitionKey', '')
                 )
                 
-                if field_validations:  # Only add results if validations were performed
-                    has_failures = any(check['status'] == 'FAILED' for check in field_validations)
-                    
-                    validation_results.append({
-                        'record': field_name,
-                        'display_name': display_name,  # Add display name
-                        'record_display_name': display_name or field_name,  # For sorting
-                        'status': 'FAILED' if has_failures else 'SUCCESS',
-                        'is_active': is_active,
-                        'partition_key': field.get('PartitionKey', ''),
-                        'details': field_validations
-                    })
-                    
-                    if has_failures:
-                        overall_success = False
-                    
-            except Exception as e:
-                overall_success = False
-                validation_results.append({
-                    'record': field.get('RowKey', 'Unknown Field'),
-                    'display_name': field.get('DisplayName', 'Unknown Field'),  # Add display name
-                    'record_display_name': field.get('DisplayName', 'Unknown Field'),  # For sorting
-                    'status': 'ERROR',
-                    'details': [{
-                        'field': 'System',
-                        'status': 'ERROR',
-                        'message': str(e)
-                    }]
-                })
-                logger.error(f"Error processing field: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error processing field: {str(e)}")
+            yield RecordResult(
+                field.get('RowKey', 'Unknown Field'),
+                field.get('DisplayName', 'Unknown Field'),
+                ERROR,
+                [make_check('system.error', str(e))]
+            )
+
+def _validate_field_shard(shard):
+    """
+    Worker entry point: validates one shard, returning its (position, result)
+    pairs in order and the shard's trace.
+    """
+    positions, fields, record_types, key_index, sample_rate = shard
+    trace = ValidationTrace(sample_rate=sample_rate)
+    shard_results = []
+    for position, field in zip(positions, fields):
+        for result in iter_validate_record_fields([field], record_types=record_types, key_index=key_index, trace=trace):
+            shard_results.append((position, result))
+    return shard_results, trace
+
+def shard_fields_by_partition_key(all_fields, shard_count):
+    """
+    Groups row positions by PartitionKey and packs the groups into shard_count
+    bins of similar size. Uniqueness is scoped to a PartitionKey, so a group is
+    never split across shards.
+    """
+    groups = {}
+    for position, field in enumerate(all_fields):
+        groups.setdefault(field.get('PartitionKey', ''), []).append(position)
+        
+    bins = [[] for _ in range(shard_count)]
+    sizes = [0] * shard_count
+    # Largest groups first; ties broken by first row so the packing is deterministic
+    for group in sorted(groups.values(), key=lambda positions: (-len(positions), positions[0])):
+        smallest = sizes.index(min(sizes))
+        bins[smallest].extend(group)
+        sizes[smallest] += len(group)
+    return [sorted(positions) for positions in bins if positions]
+
+def validate_record_fields_parallel(all_fields, record_types=None, key_index=None, max_workers=None, trace=None):
+    """
+    Validates record fields across a process pool, sharded by PartitionKey.
+    Results are merged back into upload order, so the output matches
+    iter_validate_record_fields exactly. max_workers defaults to the CPU count.
+    Worker traces are merged into trace when one is given.
+    """
+    if key_index is None:
+        key_index = build_field_key_index(all_fields)
+    record_types = as_catalog(record_types)
+    max_workers = max_workers or os.cpu_count() or 1
+    
+    if max_workers <= 1 or len(all_fields) < PARALLEL_VALIDATION_MIN_ROWS:
+        return list(iter_validate_record_fields(all_fields, record_types=record_types, key_index=key_index, trace=trace))
+    
+    try:
+        # A few shards per worker keeps the pool busy when group sizes are uneven
+        shards = shard_fields_by_partition_key(all_fields, max_workers * 4)
+    except TypeError as e:
+        logger.warning(f"Cannot shard fields by PartitionKey ({str(e)}), validating sequentially")
+        return list(iter_validate_record_fields(all_fields, record_types=record_types, key_index=key_index, trace=trace))
+        
+    # Each shard only needs the index entries for its own PartitionKeys
+    index_by_partition = {}
+    for key, rows in key_index.items():
+        index_by_partition.setdefault(key[0], {})[key] = rows
+        
+    # Workers sample at the parent's rate without needing Django settings
+    sample_rate = 1 / trace.sample_interval if trace is not None and trace.sample_interval else 0
+    tasks = []
+    for positions in shards:
+        shard_index = {}
+        for partition_key in {all_fields[position].get('PartitionKey', '') for position in positions}:
+            shard_index.update(index_by_partition.get(partition_key, {}))
+        tasks.append((positions, [all_fields[position] for position in positions], record_types, shard_index, sample_rate))
+        
+    logger.info(f"Validating {len(all_fields)} fields in {len(tasks)} shards across {max_workers} processes")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        shard_outputs = list(executor.map(_validate_field_shard, tasks))
+        
+    shard_results = []
+    for results, shard_trace in shard_outputs:
+        shard_results.append(results)
+        if trace is not None:
+            trace.merge(shard_trace)
+    return [result for _, result in heapq.merge(*shard_results, key=lambda item: item[0])]
+
+def test_validate_record_fields_from_json(json_file_path, record_types=None, all_fields=None, workers=1):
+    """Test function to validate RecordFields data from a JSON file."""
+    logger.info(f"Testing RecordFields validation with file: {json_file_path}")
+    if all_fields is not None:
+        return validate_record_field_rows(all_fields, record_types=record_types, workers=workers)
+    
+    # Two streaming passes over the file, so only one record is parsed at a time
+    return validate_record_field_rows(
+        read_json_records(json_file_path, 'record_fields'),
+        record_types=record_types,
+        workers=workers,
+        index_rows=read_json_records(json_file_path, 'record_fields')
+    )
+
+def validate_record_field_rows(all_fields, record_types=None, workers=1, index_rows=None, key_index=None):
+    """
+    Validate already-parsed RecordFields rows, returning (success, results).
+    
+    workers > 1 opts in to process-pool validation sharded by PartitionKey.
+    index_rows is a separate pass over the same rows to build the uniqueness
+    index from, or key_index the index already built from them; either lets
+    all_fields be a one-shot iterator validated as it is read.
+    """
+    try:
+        if key_index is None:
+            if index_rows is None:
+                all_fields = list(all_fields)
+                index_rows = all_fields
+            
+            # Build the uniqueness index once per run instead of scanning per field.
+            # Indexing the unfiltered rows keeps row numbers aligned with the upload;
+            # skipped rows can never share a key with a validated one.
+            key_index = build_field_key_index(index_rows)
+        
+        trace = ValidationTrace('RecordFields validation')
+        if workers > 1:
+            # Sharding needs the rows up front
+            rows = validate_record_fields_parallel(
+                list(all_fields),
+                record_types=record_types,
+                key_index=key_index,
+                max_workers=workers,
+                trace=trace
+            )
+        else:
+            rows = iter_validate_record_fields(all_fields, record_types=record_types, key_index=key_index, trace=trace)
+        validation_results = collect_results(rows)
+        validation_results.trace = trace.finish()
                 
-        return overall_success, validation_results
+        return validation_results.success, validation_results
         
     except json.JSONDecodeError as je:
         error_msg = f"Invalid JSON file: {str(je)}"
         logger.error(error_msg)
-        return False, [{
+        return False, collect_results([{
             'record': 'File Error',
             'display_name': 'File Error',  # Add display name
             'record_display_name': 'File Error',  # For sorting
@@ -384,12 +446,12 @@ def test_validate_record_fields_from_json(json_file_path, record_types=None, all
                 'status': 'ERROR',
                 'message': str(je)
             }]
-        }]
+        }])
         
     except Exception as e:
         error_msg = f"Error reading file: {str(e)}"
         logger.error(error_msg)
-        return False, [{
+        return False, collect_results([{
             'record': 'System Error',
             'display_name': 'System Error',  # Add display name
             'record_display_name': 'System Error',  # For sorting
@@ -399,4 +461,4 @@ def test_validate_record_fields_from_json(json_file_path, record_types=None, all
                 'status': 'ERROR',
                 'message': str(e)
             }]
-        }]
\ No newline at end of file
+        }])
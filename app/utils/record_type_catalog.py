@@ -0,0 +1,76 @@
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+def parse_stages_json(stages_json):
+    """Parses a StagesJson value into a list of stage dicts, or None if it is missing or malformed."""
+    if not stages_json or not isinstance(stages_json, str):
+        return None
+    try:
+        stages = json.loads(stages_json)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(stages, list):
+        return None
+    return [stage for stage in stages if isinstance(stage, dict)]
+
+class RecordTypeCatalog:
+    """
+    Lookups over a RecordTypes upload, built once and shared by the record
+    field validators: the set of names, name -> Prefix, and name -> parsed
+    StagesJson (with a set of stage names for membership checks).
+
+    Iterating a catalog yields its names, so it can stand in for the plain
+    list of record type names the validators used to take.
+    """
+
+    def __init__(self, records=()):
+        self.names = set()
+        self.prefixes = {}
+        self.stages = {}
+        self.stage_names = {}
+        self.record_count = 0
+        for record in records:
+            self.add(record)
+
+    @classmethod
+    def from_names(cls, names):
+        """Catalog with names only, for callers that pass a list of record type names."""
+        catalog = cls()
+        for name in names:
+            catalog.names.add(name)
+            catalog.record_count += 1
+        return catalog
+
+    def add(self, record):
+        """Adds one RecordTypes row."""
+        name = record.get('RowKey')
+        self.record_count += 1
+        self.names.add(name)
+        self.prefixes[name] = record.get('Prefix')
+        stages = parse_stages_json(record.get('StagesJson'))
+        if stages is not None:
+            self.stages[name] = stages
+            self.stage_names[name] = frozenset(stage.get('Name') for stage in stages)
+
+    def collect(self, records):
+        """Adds records as they pass through, so the catalog is built during another pass."""
+        for record in records:
+            self.add(record)
+            yield record
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+def as_catalog(record_types):
+    """Returns record_types as a RecordTypeCatalog, wrapping a plain list of names."""
+    if isinstance(record_types, RecordTypeCatalog):
+        return record_types
+    return RecordTypeCatalog.from_names(record_types or [])
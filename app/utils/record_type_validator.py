@@ -9,6 +9,8 @@ from .constants import (
     IGNORED_SP_FIELDS
 )
 from .stage_validator import validate_stages
+from .upload_reader import read_json_records
+from .validation_stats import collect_results
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
@@ -33,23 +35,11 @@ def map_json_to_record_type(json_data, field_mapping=RECORD_TYPE_FIELD_MAPPING):
             if settings.DEBUG:
                 logger.debug(f"Name fallback to RowKey: {value}")
             
-        # Handle boolean fields from CSV/JSON
+        # Boolean fields arrive as bools from the ingestion schema
         if model_field in ['is_enabled', 'enable_correspondence']:
+            value = json_data.get(json_field, False)
             if settings.DEBUG:
-                logger.debug(f"Processing boolean field: {model_field}")
-                logger.debug(f"JSON field name: {json_field}")
-                logger.debug(f"Raw value in JSON: {json_data.get(json_field)}")
-            
-            # First check the mapped field name (IsActive)
-            if json_field in json_data:
-                raw_value = str(json_data[json_field]).lower()
-                value = raw_value == 'true'
-                if settings.DEBUG:
-                    logger.debug(f"Boolean conversion: {raw_value} -> {value}")
-            else:
-                value = False
-                if settings.DEBUG:
-                    logger.debug(f"Field {json_field} not found, defaulting to False")
+                logger.debug(f"Boolean field {json_field}: {value}")
             
         if model_field == 'colour' and value is None:
             value = json_data.get('Color', '#000000')
@@ -172,16 +162,15 @@ def validate_record_type(record_type_obj):
                 'message': "Category format is valid"
             })
             
-        # Order validation
+        # Order validation (an int, or the uploaded value if it was not one)
         order = record_type_obj.get('order', 0)
-        try:
-            int(order)
+        if isinstance(order, int):
             validation_results.append({
                 'field': 'Order',
                 'status': 'SUCCESS',
                 'message': "Order is a valid number"
             })
-        except (ValueError, TypeError):
+        else:
             validation_results.append({
                 'field': 'Order',
                 'status': 'FAILED',
@@ -210,82 +199,74 @@ def validate_record_type(record_type_obj):
             'message': error_msg
         }]
 
-def test_validate_record_type_from_json(json_file_path, field_mapping=None):
-    """Test function to validate RecordType data from a JSON file."""
-    logger.info(f"Testing RecordType validation with file: {json_file_path}")
-    validation_results = []
+def iter_validate_record_types(records, field_mapping=None):
+    """Validates record types one at a time, yielding a result entry per record."""
+    mapping = field_mapping or RECORD_TYPE_FIELD_MAPPING
     
-    try:
-        # Read JSON file
-        with open(json_file_path, 'r') as file:
-            records = json.load(file)
+    for record in records:
+        # Skip ignored fields
+        if record.get('RowKey') in IGNORED_STATE_FIELDS or record.get('RowKey') in IGNORED_SP_FIELDS:
+            continue
             
-        # Filter out ignored fields before processing
-        filtered_records = [
-            record for record in records 
-            if record.get('RowKey') not in IGNORED_STATE_FIELDS 
-            and record.get('RowKey') not in IGNORED_SP_FIELDS
-        ]
-        
-        logger.info(f"Filtered {len(records) - len(filtered_records)} ignored fields")
-        
-        mapping = field_mapping or RECORD_TYPE_FIELD_MAPPING
-        overall_success = True
+        try:
+            # Check IsActive status first
+            is_active = record.get('IsActive', True)
+            record_name = record.get('RowKey', 'Unknown')
             
-        for record in filtered_records:
-            try:
-                # Check IsActive status first
-                is_active = str(record.get('IsActive', 'true')).lower() == 'true'
-                record_name = record.get('RowKey', 'Unknown')
-                
-                if not is_active:
-                    validation_results.append({
-                        'record': record_name,
-                        'status': 'INFO',
-                        'is_active': is_active,
-                        'details': [{
-                            'field': 'IsActive',
-                            'status': 'INFO',
-                            'message': SKIP_VALIDATION_MESSAGE
-                        }]
-                    })
-                    continue
-                
-                # Map JSON to record type object
-                mapped_data = map_json_to_record_type(record, mapping)
-                validation_checks = validate_record_type(mapped_data)
-                
-                has_failures = any(check['status'] == 'FAILED' for check in validation_checks)
-                
-                validation_results.append({
-                    'record': mapped_data['name'],
-                    'status': 'FAILED' if has_failures else 'SUCCESS',
+            if not is_active:
+                yield {
+                    'record': record_name,
+                    'status': 'INFO',
                     'is_active': is_active,
-                    'details': validation_checks
-                })
-                
-                if has_failures:
-                    overall_success = False
-                    
-            except Exception as e:
-                overall_success = False
-                validation_results.append({
-                    'record': record.get('RowKey', 'Unknown'),
-                    'status': 'ERROR',
                     'details': [{
-                        'field': 'System',
-                        'status': 'ERROR',
-                        'message': str(e)
+                        'field': 'IsActive',
+                        'status': 'INFO',
+                        'message': SKIP_VALIDATION_MESSAGE
                     }]
-                })
-                logger.error(f"Error processing record: {str(e)}")
+                }
+                continue
+            
+            # Map JSON to record type object
+            mapped_data = map_json_to_record_type(record, mapping)
+            validation_checks = validate_record_type(mapped_data)
+            
+            has_failures = any(check['status'] == 'FAILED' for check in validation_checks)
+            
+            yield {
+                'record': mapped_data['name'],
+                'status': 'FAILED' if has_failures else 'SUCCESS',
+                'is_active': is_active,
+                'details': validation_checks
+            }
+                
+        except Exception as e:
+            logger.error(f"Error processing record: {str(e)}")
+            yield {
+                'record': record.get('RowKey', 'Unknown'),
+                'status': 'ERROR',
+                'details': [{
+                    'field': 'System',
+                    'status': 'ERROR',
+                    'message': str(e)
+                }]
+            }
+
+def test_validate_record_type_from_json(json_file_path, field_mapping=None):
+    """Test function to validate RecordType data from a JSON file."""
+    logger.info(f"Testing RecordType validation with file: {json_file_path}")
+    return validate_record_type_rows(read_json_records(json_file_path, 'record_types'), field_mapping)
+
+def validate_record_type_rows(records, field_mapping=None):
+    """Validate already-parsed RecordType rows, returning (success, results)."""
+    try:
+        validation_results = collect_results(iter_validate_record_types(records, field_mapping))
                 
-        return overall_success, validation_results
+        return validation_results.success, validation_results
         
     except json.JSONDecodeError as je:
         error_msg = f"Invalid JSON file: {str(je)}"
         logger.error(error_msg)
-        return False, [{
+        return False, collect_results([{
             'record': 'File Error',
             'status': 'ERROR',
             'details': [{
@@ -293,12 +274,12 @@ def test_validate_record_type_from_json(json_file_path, field_mapping=None):
                 'status': 'ERROR',
                 'message': str(je)
             }]
-        }]
+        }])
         
     except Exception as e:
         error_msg = f"Error reading file: {str(e)}"
         logger.error(error_msg)
-        return False, [{
+        return False, collect_results([{
             'record': 'System Error',
             'status': 'ERROR',
             'details': [{
@@ -306,4 +287,4 @@ def test_validate_record_type_from_json(json_file_path, field_mapping=None):
                 'status': 'ERROR',
                 'message': str(e)
             }]
-        }]
\ No newline at end of file
+        }])
@@ -0,0 +1,199 @@
+import codecs
+import gzip
+import json
+import logging
+import os
+import re
+import zipfile
+from .constants import (
+    JSON_READ_CHUNK_SIZE,
+    UPLOAD_FORMATS,
+    GZIP_UPLOAD_EXTENSION,
+    ZIP_UPLOAD_EXTENSION
+)
+from .csv_parser import iter_csv_records
+from .ingestion_schema import iter_coerced_records
+
+logger = logging.getLogger(__name__)
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+_NUMBER_ENDS = tuple(',]' + _WHITESPACE)
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def iter_json_array(json_file, chunk_size=JSON_READ_CHUNK_SIZE):
+    """
+    Incrementally parse a JSON array from a binary (or text) file, yielding
+    one element at a time. Only the unparsed tail of the current chunk is
+    buffered, so memory stays flat however long the array is. Malformed
+    input raises json.JSONDecodeError, like json.load.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    buffer = ''
+    position = 0
+    eof = False
+
+    def fill():
+        """Drops the parsed part of the buffer and appends the next chunk."""
+        nonlocal buffer, position, eof
+        chunk = json_file.read(chunk_size)
+        eof = not chunk
+        text = decoder.decode(chunk, final=eof) if isinstance(chunk, bytes) else chunk
+        buffer = buffer[position:] + text
+        position = 0
+
+    def next_char():
+        """Skips whitespace, returning the next character ('' at the end of the file)."""
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if eof:
+                return ''
+            fill()
+
+    def error(message):
+        return json.JSONDecodeError(message, buffer, position)
+
+    fill()
+    if buffer.startswith('\ufeff'):
+        position = 1
+    if next_char() != '[':
+        raise error("Expecting a JSON array of records")
+    position += 1
+    if next_char() == ']':
+        position += 1
+    else:
+        while True:
+            # Decode the next element, reading more while it runs past the buffer
+            while True:
+                try:
+                    element, end = _decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    fill()
+                    continue
+                # A number cut by the chunk boundary decodes as a shorter one ('1.' of '1.5')
+                if not eof and _is_number(element) and buffer[end:end + 1] not in _NUMBER_ENDS:
+                    fill()
+                    continue
+                break
+            position = end
+            yield element
+
+            char = next_char()
+            position += 1
+            if char == ']':
+                break
+            if char != ',':
+                position -= 1
+                raise error("Expecting ',' delimiter")
+            next_char()
+
+    if next_char():
+        raise error("Extra data")
+
+def upload_extension(name):
+    """Lower-cased extension of an upload, keeping the format of a gzip file ('csv.gz')"""
+    parts = name.lower().split('.')
+    if len(parts) > 2 and parts[-1] == GZIP_UPLOAD_EXTENSION:
+        return '.'.join(parts[-2:])
+    return parts[-1]
+
+def is_archive_upload(upload):
+    return upload is not None and upload_extension(upload.name) == ZIP_UPLOAD_EXTENSION
+
+def paired_uploads(record_types_file, record_fields_file):
+    """
+    The (RecordTypes, RecordFields) uploads of a validation request. A zip
+    given on its own stands in for both, coming back as the same object, and
+    its members must then be opened by_name; a missing file comes back as None.
+    """
+    if record_fields_file is None and is_archive_upload(record_types_file):
+        return record_types_file, record_types_file
+    if record_types_file is None and is_archive_upload(record_fields_file):
+        return record_fields_file, record_fields_file
+    return record_types_file, record_fields_file
+
+def _normalized_member_name(name):
+    return re.sub(r'[^a-z]', '', os.path.basename(name).rsplit('.', 1)[0].lower())
+
+def _archive_member(archive, file_type, by_name=False):
+    """
+    The CSV or JSON member of a zip holding the file_type data. A lone member
+    is taken as it is unless by_name, when the zip has to hold both files.
+    """
+    members = [
+        info for info in archive.infolist()
+        if not info.is_dir()
+        and not os.path.basename(info.filename).startswith('.')
+        and '__MACOSX' not in info.filename
+        and info.filename.rsplit('.', 1)[-1].lower() in UPLOAD_FORMATS
+    ]
+    if len(members) == 1 and not by_name:
+        return members[0]
+    
+    # RecordFields exports are named after fields, RecordTypes ones after types
+    if file_type == 'record_fields':
+        matches = [info for info in members if 'field' in _normalized_member_name(info.filename)]
+    else:
+        matches = [
+            info for info in members
+            if 'type' in _normalized_member_name(info.filename)
+            and 'field' not in _normalized_member_name(info.filename)
+        ]
+    if len(matches) != 1:
+        label = 'RecordFields' if file_type == 'record_fields' else 'RecordTypes'
+        found = ', '.join(info.filename for info in members) or 'no CSV or JSON files'
+        raise ValueError(f"Could not find a single {label} file in the zip archive (found {found})")
+    return matches[0]
+
+def open_upload(upload, file_type, by_name=False):
+    """
+    The CSV or JSON stream inside an upload, named after the file it holds.
+    gzip files and zip members are decompressed as they are read, so nothing
+    decompressed is written to disk; plain uploads are returned as they are.
+    Rewinding the stream restarts decompression, which keeps two-pass reads
+    working at the cost of decompressing twice. by_name is set when a zip
+    stands in for both files (see paired_uploads).
+    """
+    extension = upload_extension(upload.name)
+    upload.seek(0)
+    try:
+        if extension.endswith(f".{GZIP_UPLOAD_EXTENSION}"):
+            stream = gzip.GzipFile(filename=upload.name[:-len(GZIP_UPLOAD_EXTENSION) - 1], mode='rb', fileobj=upload)
+            # Surface a corrupt header here rather than halfway through parsing
+            stream.peek(1)
+        elif extension == ZIP_UPLOAD_EXTENSION:
+            archive = zipfile.ZipFile(upload)
+            stream = archive.open(_archive_member(archive, file_type, by_name))
+        else:
+            return upload
+    except (OSError, EOFError, zipfile.BadZipFile) as e:
+        raise ValueError(f"Could not decompress {upload.name}: {str(e)}")
+    
+    logger.info(f"Reading {stream.name} from {upload.name}")
+    return stream
+
+def iter_upload_records(upload, file_type, include_skipped=False):
+    """
+    Yield records from an uploaded (or saved) CSV or JSON file, typed by the
+    ingestion schema. include_skipped keeps the rows the CSV reader would
+    drop, so every format yields each row of the source in file order.
+    """
+    file_extension = upload.name.split('.')[-1].lower()
+    if file_extension == 'csv':
+        yield from iter_csv_records(upload, file_type, include_skipped=include_skipped)
+    else:
+        upload.seek(0)
+        yield from iter_coerced_records(iter_json_array(upload), file_type)
+
+def read_json_records(json_file_path, file_type):
+    """Lazily read records from a JSON file, so decode errors surface during validation."""
+    with open(json_file_path, 'rb') as file:
+        yield from iter_coerced_records(iter_json_array(file), file_type)
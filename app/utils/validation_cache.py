@@ -0,0 +1,39 @@
+import hashlib
+import logging
+from django.core.cache import caches
+from .constants import VALIDATION_RULES_VERSION
+
+logger = logging.getLogger(__name__)
+
+VALIDATION_CACHE_ALIAS = 'validation'
+
+def upload_digest(upload):
+    """SHA-256 of an uploaded file's name extension and content, read chunk by chunk."""
+    digest = hashlib.sha256()
+    digest.update(upload.name.split('.')[-1].lower().encode('utf-8'))
+    for chunk in upload.chunks():
+        digest.update(chunk)
+    upload.seek(0)
+    return digest.hexdigest()
+
+def validation_cache_key(record_types_file, record_fields_file):
+    """Content-addressed cache key for a RecordTypes/RecordFields upload pair."""
+    return (
+        f"validation:{VALIDATION_RULES_VERSION}:"
+        f"{upload_digest(record_types_file)}:{upload_digest(record_fields_file)}"
+    )
+
+def get_cached_validation(cache_key):
+    """Returns cached validation results for the key, or None."""
+    try:
+        return caches[VALIDATION_CACHE_ALIAS].get(cache_key)
+    except Exception as e:
+        logger.warning(f"Validation cache read failed: {str(e)}")
+        return None
+
+def set_cached_validation(cache_key, results):
+    """Stores validation results; cache failures never fail the validation itself."""
+    try:
+        caches[VALIDATION_CACHE_ALIAS].set(cache_key, results)
+    except Exception as e:
+        logger.warning(f"Validation cache write failed: {str(e)}")
@@ -0,0 +1,103 @@
+import csv
+import json
+import logging
+from xml.sax.saxutils import escape, quoteattr
+from .validation_result import result_without_stats, serialize_result, FAILED, ERROR, INFO
+
+logger = logging.getLogger(__name__)
+
+# Report format -> (content type, file extension)
+REPORT_FORMATS = {
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'csv': ('text/csv', 'csv'),
+    'junit': ('application/xml', 'xml'),
+}
+
+REPORT_CSV_HEADER = [
+    'Section',
+    'PartitionKey',
+    'Record',
+    'DisplayName',
+    'RecordStatus',
+    'Field',
+    'Status',
+    'Message'
+]
+
+class EchoBuffer:
+    """File-like object whose write() returns the line, so csv.writer can feed a generator."""
+
+    def write(self, value):
+        return value
+
+def iter_ndjson_report(sections):
+    """
+    One JSON object per result and line. sections is an iterable of
+    (section title, results) pairs; results are read lazily.
+    """
+    for section, results in sections:
+        for result in results:
+            yield json.dumps({'section': section, **result_without_stats(result)}, default=serialize_result) + '\n'
+
+def iter_csv_report(sections):
+    """One CSV row per check, with its result's record and status repeated on each row."""
+    writer = csv.writer(EchoBuffer())
+    yield writer.writerow(REPORT_CSV_HEADER)
+    for section, results in sections:
+        for result in results:
+            for detail in result.get('details') or [{}]:
+                yield writer.writerow([
+                    section,
+                    result.get('partition_key') or '',
+                    result.get('record', ''),
+                    result.get('display_name') or '',
+                    result.get('status', ''),
+                    detail.get('field', ''),
+                    detail.get('status', ''),
+                    detail.get('message', '')
+                ])
+
+def iter_junit_report(name, sections):
+    """
+    JUnit XML with a testsuite per section and a testcase per result: FAILED
+    results are failures, ERROR results errors and INFO results skipped.
+    sections is an iterable of (section title, results, counts), where counts
+    holds the section's tests/failures/errors totals for the testsuite tag.
+    """
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield f'<testsuites name={quoteattr(name)}>\n'
+    for section, results, counts in sections:
+        yield (
+            f'  <testsuite name={quoteattr(section)} tests="{counts["tests"]}" '
+            f'failures="{counts["failures"]}" errors="{counts["errors"]}">\n'
+        )
+        for result in results:
+            yield junit_testcase(section, result)
+        yield '  </testsuite>\n'
+    yield '</testsuites>\n'
+
+def junit_testcase(section, result):
+    """The <testcase> element for one result."""
+    name = result.get('record', '')
+    if result.get('display_name'):
+        name = f"{result['display_name']} ({name})"
+    classname = result.get('partition_key') or section
+    opening = f'    <testcase classname={quoteattr(str(classname))} name={quoteattr(str(name))}'
+
+    status = result.get('status')
+    if status not in (FAILED, ERROR, INFO):
+        return opening + '/>\n'
+
+    details = result.get('details') or []
+    if status == INFO:
+        message = details[0].get('message', '') if details else ''
+        return f'{opening}>\n      <skipped message={quoteattr(str(message))}/>\n    </testcase>\n'
+
+    tag = 'failure' if status == FAILED else 'error'
+    problems = [detail for detail in details if detail.get('status') in (FAILED, ERROR)]
+    body = '\n'.join(f"{detail.get('field', '')}: {detail.get('message', '')}" for detail in problems)
+    summary = f"{len(problems)} check(s) {status.lower()}"
+    return (
+        f'{opening}>\n      <{tag} message={quoteattr(summary)}>{escape(body)}</{tag}>\n'
+        f'    </testcase>\n'
+    )
@@ -0,0 +1,186 @@
+import logging
+from .constants import SKIP_VALIDATION_MESSAGE, VALID_FIELD_TYPES
+
+logger = logging.getLogger(__name__)
+
+# Statuses are shared module-level strings, so every result refers to the same object
+SUCCESS = 'SUCCESS'
+FAILED = 'FAILED'
+ERROR = 'ERROR'
+INFO = 'INFO'
+WARNING = 'WARNING'
+
+# RecordFields rules: rule ID -> (field, status, message template).
+# Templates take the check's arguments positionally; callables build messages
+# that need more than str.format.
+FIELD_RULES = {
+    'inactive.skipped': ('IsActive', INFO, SKIP_VALIDATION_MESSAGE),
+    'inactive.system_mandatory': ('IsActive', INFO, "Core field '{0}' is marked as inactive but will be shown on UI as it is system mandatory"),
+    'inactive.core_not_hidden': ('IsActive', ERROR, "Core field '{0}' will not be hidden. To hide, set NotEditable to true, or to show, set IsActive to true and NotEditable to false"),
+    'inactive.core_not_editable': ('IsActive', INFO, "Core field '{0}' is marked as inactive and not editable"),
+    'partition_key.required': ('PartitionKey', FAILED, "PartitionKey is required"),
+    'partition_key.unknown': ('PartitionKey', FAILED, "PartitionKey '{0}' does not match any Record Type"),
+    'partition_key.valid': ('PartitionKey', SUCCESS, "Valid Record Type: {0}"),
+    'unique_key.duplicate': ('Unique Key', FAILED, lambda partition_key, row_key, rows: (
+        f"Combination of PartitionKey '{partition_key}' and RowKey '{row_key}' is not unique "
+        f"(rows {', '.join(map(str, rows))})"
+    )),
+    'unique_key.unique': ('Unique Key', SUCCESS, "Field key is unique"),
+    'row_key.invalid': ('RowKey Format', FAILED, "RowKey must contain only alphanumeric characters (no spaces)"),
+    'row_key.valid': ('RowKey Format', SUCCESS, "RowKey format is valid"),
+    'field_types.match': ('FiledType', INFO, "FiledType present and matches FieldType (value: {0})"),
+    'field_types.mismatch': ('Field Types', FAILED, "FieldType ({0}) does not match FiledType ({1})"),
+    'field_types.filed_only': ('FiledType', INFO, "FiledType present with value: {0}"),
+    'datasource.missing': ('DataSourceName', FAILED, "DataSourceName is required for field type {0}"),
+    'datasource.present': ('DataSourceName', INFO, "Term set must exactly match: {0}"),
+    'display_name.missing': ('Display Name', FAILED, "Display name is required"),
+    'display_name.valid': ('Display Name', SUCCESS, "Display name is valid"),
+    'field_type.invalid': ('FieldType', FAILED, "Invalid field type: {0}. Must be one of " + str(list(VALID_FIELD_TYPES.keys()))),
+    'field_type.valid': ('FieldType', SUCCESS, "Valid field type: {0}"),
+    'field_type.not_integer': ('FieldType', FAILED, "FieldType must be a valid integer"),
+    'wizard.role_field': ('WizardPosition', INFO, "Role field - will appear on People and Roles page"),
+    'wizard.default': ('WizardPosition', INFO, "WizardPosition not specified - defaulting to 0 (Record Information page)"),
+    'wizard.invalid': ('WizardPosition', FAILED, "Invalid WizardPosition value: {0}. Must be 0 (Record Information) or 1 (Record Response)"),
+    'wizard.information_page': ('WizardPosition', SUCCESS, "Field will appear on Record Information page"),
+    'wizard.response_page': ('WizardPosition', SUCCESS, "Field will appear on Record Response page"),
+    'wizard.not_integer': ('WizardPosition', FAILED, "WizardPosition must be a valid integer (0 or 1), got: {0}"),
+    'role_stage.valid': ('Stages', SUCCESS, "Stage '{0}' exists in Record Type '{1}'"),
+    'role_stage.unknown': ('Stages', FAILED, "Stage '{0}' does not exist in the StagesJson of Record Type '{1}'"),
+    'system.unexpected': ('System', ERROR, "Unexpected error: {0}"),
+    'system.error': ('System', ERROR, "{0}"),
+}
+
+class Check:
+    """
+    One rule outcome: a rule ID plus the values its message needs. Field and
+    status come from the rule table; the message is only formatted when read.
+    Supports dict-style reads so templates and callers can treat it like the
+    {'field', 'status', 'message'} dicts used elsewhere.
+    """
+    __slots__ = ('rule', 'args')
+
+    def __init__(self, rule, args=()):
+        self.rule = rule
+        self.args = args
+
+    @property
+    def field(self):
+        return FIELD_RULES[self.rule][0]
+
+    @property
+    def status(self):
+        return FIELD_RULES[self.rule][1]
+
+    @property
+    def message(self):
+        template = FIELD_RULES[self.rule][2]
+        if callable(template):
+            return template(*self.args)
+        return template.format(*self.args) if self.args else template
+
+    def __getitem__(self, key):
+        if key in ('field', 'status', 'message'):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        return {'field': self.field, 'status': self.status, 'message': self.message}
+
+    def __eq__(self, other):
+        if isinstance(other, Check):
+            return self.rule == other.rule and self.args == other.args
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Check({self.rule!r}, {self.args!r})"
+
+# Checks without arguments are immutable and identical, so one instance is shared
+_SHARED_CHECKS = {rule: Check(rule) for rule in FIELD_RULES}
+
+def make_check(rule, *args):
+    """Returns the Check for a rule, reusing the shared instance when there are no arguments."""
+    if not args:
+        return _SHARED_CHECKS[rule]
+    return Check(rule, args)
+
+class RecordResult:
+    """Validation outcome for one RecordFields row, with dict-style reads like Check."""
+    __slots__ = ('record', 'display_name', 'status', 'is_active', 'partition_key', 'details', 'stats')
+
+    FIELDS = ('record', 'display_name', 'record_display_name', 'status', 'is_active', 'partition_key', 'details', 'stats')
+
+    def __init__(self, record, display_name, status, details, is_active=None, partition_key=None):
+        self.record = record
+        self.display_name = display_name
+        self.status = status
+        self.is_active = is_active
+        self.partition_key = partition_key
+        self.details = details
+        self.stats = None
+
+    @property
+    def record_display_name(self):
+        """Sort key used by the results template."""
+        return self.display_name or self.record
+
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        return {
+            'record': self.record,
+            'display_name': self.display_name,
+            'record_display_name': self.record_display_name,
+            'status': self.status,
+            'is_active': self.is_active,
+            'partition_key': self.partition_key,
+            'details': [detail.to_dict() if isinstance(detail, Check) else detail for detail in self.details]
+        }
+
+    def __eq__(self, other):
+        if isinstance(other, RecordResult):
+            return all(getattr(self, name) == getattr(other, name) for name in self.__slots__ if name != 'stats')
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"RecordResult({self.record!r}, {self.status!r})"
+
+def any_failed(checks):
+    """Returns True if any check in the list FAILED."""
+    return any(item.status == FAILED for item in checks)
+
+def result_without_stats(result):
+    """
+    A result as it is stored and reported: plain dict results lose the
+    per-row `stats` ValidationStats attaches for the templates, which
+    RecordResult.to_dict already leaves out.
+    """
+    if isinstance(result, dict) and 'stats' in result:
+        return {key: value for key, value in result.items() if key != 'stats'}
+    return result
+
+def serialize_result(value):
+    """json.dumps default hook: converts result objects to plain dicts."""
+    if isinstance(value, (Check, RecordResult)):
+        return value.to_dict()
+    return str(value)
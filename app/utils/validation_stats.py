@@ -0,0 +1,157 @@
+import logging
+from .validation_result import SUCCESS, FAILED, ERROR, INFO, WARNING
+
+logger = logging.getLogger(__name__)
+
+STATUS_COUNT_KEYS = {
+    SUCCESS: 'success',
+    FAILED: 'failed',
+    ERROR: 'error',
+    INFO: 'info',
+    WARNING: 'warning'
+}
+
+def new_status_counts():
+    """Empty per-status counters, in the shape the results template reads."""
+    return {key: 0 for key in STATUS_COUNT_KEYS.values()}
+
+class StatusCounts:
+    """Read-only per-status counts for one result's details."""
+    __slots__ = ('success', 'failed', 'error', 'info', 'warning')
+
+    def __init__(self, success=0, failed=0, error=0, info=0, warning=0):
+        self.success = success
+        self.failed = failed
+        self.error = error
+        self.info = info
+        self.warning = warning
+
+    def as_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __repr__(self):
+        return f"StatusCounts({self.as_dict()!r})"
+
+# Most rows share the same status mix, so each distinct mix is stored once
+_SHARED_COUNTS = {}
+
+def shared_status_counts(counts):
+    """Returns the shared StatusCounts for a dict of per-status counts."""
+    key = tuple(counts[name] for name in StatusCounts.__slots__)
+    try:
+        return _SHARED_COUNTS[key]
+    except KeyError:
+        return _SHARED_COUNTS.setdefault(key, StatusCounts(*key))
+
+def _status_key(status):
+    return STATUS_COUNT_KEYS.get(str(status or '').upper())
+
+def detail_rule(detail):
+    """Rule a detail is counted and filtered under: compact checks carry a rule ID, plain dicts a field."""
+    return getattr(detail, 'rule', None) or detail.get('field')
+
+class ValidationStats:
+    """
+    Running counters for a validation run: totals and per-PartitionKey counts
+    (result statuses plus INFO/WARNING details), and per-rule detail counts.
+    Each added result also gets its own detail counts attached as `stats`,
+    for the templates only: results are stored without them.
+    """
+
+    def __init__(self):
+        self.totals = new_status_counts()
+        self.by_partition = {}
+        self.by_rule = {}
+
+    @property
+    def success(self):
+        return self.totals['failed'] == 0 and self.totals['error'] == 0
+
+    def add(self, result):
+        """Counts one result and attaches its per-detail counts."""
+        partition_counts = self.by_partition.get(result.get('partition_key'))
+        if partition_counts is None:
+            partition_counts = self.by_partition[result.get('partition_key')] = new_status_counts()
+
+        key = _status_key(result.get('status'))
+        if key:
+            self.totals[key] += 1
+            partition_counts[key] += 1
+
+        row_counts = new_status_counts()
+        for detail in result.get('details') or []:
+            key = _status_key(detail.get('status'))
+            if not key:
+                continue
+            row_counts[key] += 1
+            if key in ('info', 'warning'):
+                self.totals[key] += 1
+                partition_counts[key] += 1
+            rule = detail_rule(detail)
+            rule_counts = self.by_rule.get(rule)
+            if rule_counts is None:
+                rule_counts = self.by_rule[rule] = new_status_counts()
+            rule_counts[key] += 1
+
+        stats = shared_status_counts(row_counts)
+        if isinstance(result, dict):
+            result['stats'] = stats
+        else:
+            result.stats = stats
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuilds stats stored with as_dict(); the per-status counts stay plain dicts."""
+        stats = cls()
+        stats.totals.update(data.get('totals', {}))
+        stats.by_partition = dict(data.get('by_partition', {}))
+        stats.by_rule = dict(data.get('by_rule', {}))
+        return stats
+
+    def as_dict(self):
+        return {
+            'success': self.success,
+            'totals': dict(self.totals),
+            'by_partition': {key: dict(counts) for key, counts in self.by_partition.items()},
+            'by_rule': {key: dict(counts) for key, counts in self.by_rule.items()}
+        }
+
+class ValidationResults(list):
+    """
+    A validator's result list, together with the ValidationStats counted while
+    building it and, when the validator recorded one, its ValidationTrace.
+    """
+
+    def __init__(self, results=()):
+        super().__init__()
+        self.stats = ValidationStats()
+        self.trace = None
+        for result in results:
+            self.append(result)
+
+    def append(self, result):
+        self.stats.add(result)
+        super().append(result)
+
+    def extend(self, results):
+        for result in results:
+            self.append(result)
+
+    @property
+    def success(self):
+        return self.stats.success
+
+    def __reduce__(self):
+        # Rebuild from the stored counts instead of re-counting through append()
+        return (_restore_results, (list(self), self.stats, self.trace))
+
+def _restore_results(results, stats, trace=None):
+    restored = ValidationResults()
+    list.extend(restored, results)
+    restored.stats = stats
+    restored.trace = trace
+    return restored
+
+def collect_results(results):
+    """Collects results into a ValidationResults list, counting them in the same pass."""
+    return ValidationResults(results)
@@ -0,0 +1,89 @@
+import logging
+import time
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+class ValidationTrace:
+    """
+    Per-rule wall time and call counts for one validation run, plus the row
+    sampling used for per-row logging. sample_rate is the fraction of rows
+    whose rule-by-rule progress is logged (0 disables per-row logging).
+    """
+
+    def __init__(self, name='validation', sample_rate=None):
+        if sample_rate is None:
+            sample_rate = getattr(settings, 'VALIDATION_LOG_SAMPLE_RATE', 0)
+        self.name = name
+        self.sample_interval = round(1 / sample_rate) if sample_rate > 0 else 0
+        self.rows = 0
+        self.rules = {}
+        self.started = time.perf_counter()
+        self.elapsed = None
+
+    def next_row(self):
+        """Counts a row, returning True if it falls in the logging sample."""
+        self.rows += 1
+        return self.sample_interval > 0 and self.rows % self.sample_interval == 1 % self.sample_interval
+
+    def record(self, rule, started):
+        """Adds the time since started (a perf_counter value) to a rule, returning the current time."""
+        now = time.perf_counter()
+        timing = self.rules.get(rule)
+        if timing is None:
+            self.rules[rule] = [1, now - started]
+        else:
+            timing[0] += 1
+            timing[1] += now - started
+        return now
+
+    def merge(self, other):
+        """Folds in a trace from another process or shard."""
+        self.rows += other.rows
+        for rule, (calls, seconds) in other.rules.items():
+            timing = self.rules.setdefault(rule, [0, 0.0])
+            timing[0] += calls
+            timing[1] += seconds
+
+    def finish(self):
+        """Stops the clock and writes the single summary record for the run."""
+        self.elapsed = time.perf_counter() - self.started
+        slowest = self.rule_timings()[:3]
+        logger.info(
+            "%s: %d rows in %.3fs; slowest rules: %s",
+            self.name,
+            self.rows,
+            self.elapsed,
+            ', '.join(f"{timing['rule']} {timing['total_ms']:.1f}ms" for timing in slowest) or 'none'
+        )
+        return self
+
+    def rule_timings(self):
+        """Rules ordered by total time, slowest first."""
+        timings = [{
+            'rule': rule,
+            'calls': calls,
+            'total_ms': seconds * 1000,
+            'avg_us': seconds * 1000000 / calls if calls else 0
+        } for rule, (calls, seconds) in self.rules.items()]
+        return sorted(timings, key=lambda timing: timing['total_ms'], reverse=True)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuilds a finished trace stored with as_dict()."""
+        trace = cls(data.get('name', 'validation'), sample_rate=0)
+        trace.rows = data.get('rows', 0)
+        trace.elapsed = data.get('elapsed_ms', 0) / 1000
+        trace.rules = {
+            timing['rule']: [timing['calls'], timing['total_ms'] / 1000]
+            for timing in data.get('rules', [])
+        }
+        return trace
+
+    def as_dict(self):
+        return {
+            'name': self.name,
+            'rows': self.rows,
+            'elapsed_ms': (self.elapsed or 0) * 1000,
+            'rules': self.rule_timings()
+        }
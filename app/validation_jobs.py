@@ -0,0 +1,392 @@
+import json
+import logging
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connection, transaction
+from django.utils import timezone
+from .models import ValidationJob, ValidationJobResult, ValidationJobIndex
+from .utils.upload_reader import iter_upload_records, open_upload, upload_extension
+from .utils.record_type_validator import iter_validate_record_types
+from .utils.record_field_validator import iter_validate_record_fields, build_field_key_index
+from .utils.validation_result import result_without_stats, serialize_result
+from .utils.validation_stats import ValidationResults, ValidationStats, detail_rule
+from .utils.validation_trace import ValidationTrace
+from .utils.record_type_catalog import RecordTypeCatalog
+from .utils.constants import VALIDATION_JOB_CHUNK_SIZE, VALIDATION_RESULTS_PAGE_SIZE
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    """Lazily create the per-process worker pool that runs validation jobs"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.VALIDATION_JOB_WORKERS,
+                thread_name_prefix='validation-job'
+            )
+    return _executor
+
+def get_job_directory(job_id):
+    """Directory holding a job's uploaded files until it finishes"""
+    return os.path.join(settings.VALIDATION_JOB_DIR, str(job_id))
+
+def update_job(job_id, **fields):
+    """
+    Update a job's fields, stamping updated_at (which queryset updates skip)
+    so a running job's progress doubles as its heartbeat
+    """
+    ValidationJob.objects.filter(pk=job_id).update(updated_at=timezone.now(), **fields)
+
+def save_job_upload(upload, job_directory, file_type):
+    """Copy an upload into the job directory as sent, keeping its extension (and any compression)"""
+    file_extension = upload_extension(upload.name)
+    path = os.path.join(job_directory, f"{file_type}.{file_extension}")
+    with open(path, 'wb') as destination:
+        for chunk in upload.chunks():
+            destination.write(chunk)
+    return path
+
+def submit_validation_job(record_types_file, record_fields_file, key_index=None):
+    """
+    Queue a validation job for an upload pair and return it. A key_index the
+    caller already built from the Record Fields file spares the job its first pass.
+    """
+    prune_validation_runs()
+    job = ValidationJob.objects.create(
+        record_types_file=record_types_file.name,
+        record_fields_file=record_fields_file.name
+    )
+    job_directory = get_job_directory(job.id)
+    os.makedirs(job_directory, exist_ok=True)
+    if record_types_file is record_fields_file:
+        # A zip standing in for both files is saved once
+        types_path = fields_path = save_job_upload(record_types_file, job_directory, 'upload')
+    else:
+        types_path = save_job_upload(record_types_file, job_directory, 'record_types')
+        fields_path = save_job_upload(record_fields_file, job_directory, 'record_fields')
+
+    get_executor().submit(run_validation_job, job.id, types_path, fields_path, key_index)
+    logger.info(f"Queued validation job {job.id}")
+    return job
+
+def index_result(index, section, position, result):
+    """Add a result's position under its status, PartitionKey and rules"""
+    # Record types are filtered by name, the PartitionKey their fields refer to
+    partition_key = result.get('partition_key') if section == 'fields' else result.get('record')
+    values = {('status', result.get('status')), ('partition_key', partition_key)}
+    values.update(('rule', detail_rule(detail)) for detail in result.get('details') or [])
+    for facet, value in values:
+        if value is None or value == '':
+            continue
+        index.setdefault((facet, str(value)[:255]), []).append(position)
+
+def store_job_results(job_id, section, results, progress):
+    """
+    Store results in chunks as they are produced, updating the job's progress
+    after each chunk, then the section's filter index. Returns the section's
+    ValidationStats.
+    """
+    stats = ValidationStats()
+    index = {}
+    sequence = 0
+    chunk = []
+
+    def flush():
+        ValidationJobResult.objects.create(
+            job_id=job_id,
+            section=section,
+            sequence=sequence,
+            results_json=json.dumps([result_without_stats(result) for result in chunk], default=serialize_result)
+        )
+        update_job(job_id, processed=progress['processed'])
+
+    # Chunks are exactly VALIDATION_JOB_CHUNK_SIZE long, so a position maps to (sequence, offset)
+    for position, result in enumerate(results):
+        stats.add(result)
+        index_result(index, section, position, result)
+        chunk.append(result)
+        if len(chunk) >= VALIDATION_JOB_CHUNK_SIZE:
+            flush()
+            sequence += 1
+            chunk = []
+    if chunk:
+        flush()
+    # Positions are chunked like the results, so a filtered page decodes one or two chunks
+    ValidationJobIndex.objects.bulk_create([
+        ValidationJobIndex(
+            job_id=job_id,
+            section=section,
+            facet=facet,
+            value=value,
+            sequence=start // VALIDATION_JOB_CHUNK_SIZE,
+            positions_json=json.dumps(positions[start:start + VALIDATION_JOB_CHUNK_SIZE])
+        )
+        for (facet, value), positions in index.items()
+        for start in range(0, len(positions), VALIDATION_JOB_CHUNK_SIZE)
+    ], batch_size=VALIDATION_JOB_CHUNK_SIZE)
+    update_job(job_id, processed=progress['processed'])
+    return stats
+
+def job_summary(types_stats, field_stats, trace=None):
+    """Serialized section counts and field trace, stored on the job for the results page"""
+    return json.dumps({
+        'types': types_stats.as_dict(),
+        'fields': field_stats.as_dict(),
+        'trace': trace.as_dict() if trace else None
+    })
+
+def store_validation_run(record_types_file, record_fields_file, record_type_results, field_results):
+    """
+    Store the results of a validation that ran in the request as a finished
+    job, so they are paged and filtered from the database like job results
+    """
+    prune_validation_runs()
+    total = len(record_type_results) + len(field_results)
+    with transaction.atomic():
+        job = ValidationJob.objects.create(
+            record_types_file=record_types_file,
+            record_fields_file=record_fields_file,
+            status='running',
+            total=total
+        )
+        progress = {'processed': total}
+        types_stats = store_job_results(job.id, 'types', record_type_results, progress)
+        field_stats = store_job_results(job.id, 'fields', field_results, progress)
+        job.status = 'done'
+        job.processed = total
+        job.success = types_stats.success and field_stats.success
+        job.summary_json = job_summary(types_stats, field_stats, getattr(field_results, 'trace', None))
+        job.save(update_fields=['status', 'processed', 'success', 'summary_json', 'updated_at'])
+    logger.info(f"Stored validation run {job.id} ({total} results)")
+    return job
+
+def fail_stale_jobs():
+    """
+    Mark queued or running jobs that have not written for
+    VALIDATION_JOB_STALE_MINUTES as failed, removing their uploads: their
+    worker died with its process, so nothing else will finish them
+    """
+    cutoff = timezone.now() - timedelta(minutes=settings.VALIDATION_JOB_STALE_MINUTES)
+    stale_ids = list(ValidationJob.objects.filter(
+        status__in=['queued', 'running'],
+        updated_at__lt=cutoff
+    ).values_list('pk', flat=True))
+    if not stale_ids:
+        return
+    ValidationJob.objects.filter(pk__in=stale_ids, status__in=['queued', 'running']).update(
+        status='failed',
+        success=False,
+        error=f"Validation job stopped without finishing (no progress since {cutoff})",
+        updated_at=timezone.now()
+    )
+    for job_id in stale_ids:
+        shutil.rmtree(get_job_directory(job_id), ignore_errors=True)
+    logger.warning(f"Marked {len(stale_ids)} stale validation jobs as failed")
+
+def prune_validation_runs():
+    """
+    Fail stale jobs, then delete finished runs older than
+    VALIDATION_RUN_MAX_AGE_HOURS with their stored results and any uploads left behind
+    """
+    fail_stale_jobs()
+    cutoff = timezone.now() - timedelta(hours=settings.VALIDATION_RUN_MAX_AGE_HOURS)
+    expired = ValidationJob.objects.filter(status__in=['done', 'failed'], created_at__lt=cutoff)
+    expired_ids = list(expired.values_list('pk', flat=True))
+    if not expired_ids:
+        return
+    deleted, _ = ValidationJob.objects.filter(pk__in=expired_ids).delete()
+    for job_id in expired_ids:
+        shutil.rmtree(get_job_directory(job_id), ignore_errors=True)
+    logger.info(f"Pruned {deleted} stored validation rows older than {cutoff}")
+
+def count_rows(records, progress):
+    """Pass records through, counting how many have been read"""
+    for record in records:
+        progress['processed'] += 1
+        yield record
+
+def run_validation_job(job_id, types_path, fields_path, key_index=None):
+    """Worker entry point: validate both files, storing progress and partial results"""
+    try:
+        update_job(job_id, status='running', stage='Record Types')
+        progress = {'processed': 0}
+
+        with open(types_path, 'rb') as types_upload, open(fields_path, 'rb') as fields_upload:
+            shared_upload = types_path == fields_path
+            types_file = open_upload(types_upload, 'record_types', by_name=shared_upload)
+            fields_file = open_upload(fields_upload, 'record_fields', by_name=shared_upload)
+            
+            # Size both files first so the page can show a percentage
+            record_types = RecordTypeCatalog(iter_upload_records(types_file, 'record_types'))
+            if key_index is None:
+                key_index = build_field_key_index(iter_upload_records(fields_file, 'record_fields', include_skipped=True))
+            total = record_types.record_count + sum(len(rows) for rows in key_index.values())
+            update_job(job_id, total=total)
+
+            types_stats = store_job_results(job_id, 'types', iter_validate_record_types(
+                count_rows(iter_upload_records(types_file, 'record_types'), progress)
+            ), progress)
+
+            update_job(job_id, stage='Record Fields')
+            trace = ValidationTrace(f"Validation job {job_id}")
+            field_stats = store_job_results(job_id, 'fields', iter_validate_record_fields(
+                count_rows(iter_upload_records(fields_file, 'record_fields'), progress),
+                record_types=record_types,
+                key_index=key_index,
+                trace=trace
+            ), progress)
+            trace.finish()
+
+        # The total counts CSV rows the reader drops, which are never processed
+        update_job(
+            job_id,
+            status='done',
+            stage='',
+            processed=total,
+            success=types_stats.success and field_stats.success,
+            summary_json=job_summary(types_stats, field_stats, trace)
+        )
+        logger.info(f"Validation job {job_id} complete")
+
+    except Exception as e:
+        logger.exception(f"Validation job {job_id} failed")
+        update_job(job_id, status='failed', success=False, error=str(e))
+
+    finally:
+        shutil.rmtree(get_job_directory(job_id), ignore_errors=True)
+        # Worker threads hold their own connection; release it between jobs
+        connection.close()
+
+def load_job_summary(job):
+    """The stored (types stats, field stats, field trace) of a job; empty while it is still running"""
+    summary = json.loads(job.summary_json) if job.summary_json else {}
+    trace = ValidationTrace.from_dict(summary['trace']) if summary.get('trace') else None
+    return (
+        ValidationStats.from_dict(summary.get('types', {})),
+        ValidationStats.from_dict(summary.get('fields', {})),
+        trace
+    )
+
+def count_section_results(job, section):
+    """Number of stored results in a section, from its last chunk"""
+    last_chunk = job.result_chunks.filter(section=section).order_by('-sequence').first()
+    if last_chunk is None:
+        return 0
+    return last_chunk.sequence * VALIDATION_JOB_CHUNK_SIZE + len(json.loads(last_chunk.results_json))
+
+class IndexedPositions:
+    """
+    The positions stored under one filter value, as a sequence. Like
+    StoredResults, slicing loads only the index chunks the slice touches.
+    """
+
+    def __init__(self, job, section, facet, value):
+        self.entries = job.result_index.filter(section=section, facet=facet, value=value)
+        self._count = None
+
+    def __len__(self):
+        if self._count is None:
+            last_entry = self.entries.order_by('-sequence').first()
+            self._count = 0 if last_entry is None else (
+                last_entry.sequence * VALIDATION_JOB_CHUNK_SIZE + len(json.loads(last_entry.positions_json))
+            )
+        return self._count
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        offsets = range(len(self))[index]
+        sequences = {offset // VALIDATION_JOB_CHUNK_SIZE for offset in offsets}
+        chunks = {
+            entry.sequence: json.loads(entry.positions_json)
+            for entry in self.entries.filter(sequence__in=sequences)
+        }
+        return [chunks[offset // VALIDATION_JOB_CHUNK_SIZE][offset % VALIDATION_JOB_CHUNK_SIZE] for offset in offsets]
+
+def filter_positions(job, section, filters):
+    """
+    Positions of the section's results matching every filter, or None when no
+    filter is set. A single filter is read lazily; combined filters are
+    intersected, which decodes each of their positions once.
+    """
+    matches = [IndexedPositions(job, section, facet, value) for facet, value in filters.items()]
+    if not matches:
+        return None
+    if len(matches) == 1:
+        return matches[0]
+    positions = set(matches[0][:])
+    for matched in matches[1:]:
+        positions.intersection_update(matched[:])
+    return sorted(positions)
+
+class StoredResults:
+    """
+    A job section's stored results (or those at the given positions) as a
+    sequence for Paginator. Slicing loads only the chunks the slice touches.
+    """
+
+    def __init__(self, job, section, positions=None):
+        self.job = job
+        self.section = section
+        self.positions = positions
+        self._count = None
+
+    def __len__(self):
+        if self.positions is not None:
+            return len(self.positions)
+        if self._count is None:
+            self._count = count_section_results(self.job, self.section)
+        return self._count
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        positions = self.positions[index] if self.positions is not None else range(len(self))[index]
+        sequences = {position // VALIDATION_JOB_CHUNK_SIZE for position in positions}
+        chunks = {
+            chunk.sequence: json.loads(chunk.results_json)
+            for chunk in self.job.result_chunks.filter(section=self.section, sequence__in=sequences)
+        }
+        # Recounting the page reattaches each result's per-row stats
+        return ValidationResults(
+            chunks[position // VALIDATION_JOB_CHUNK_SIZE][position % VALIDATION_JOB_CHUNK_SIZE]
+            for position in positions
+        )
+
+def iter_job_results(job, section):
+    """Yield a job section's stored results one chunk at a time, so the whole run is never held in memory"""
+    chunks = job.result_chunks.filter(section=section).order_by('sequence').values_list('results_json', flat=True)
+    for results_json in chunks.iterator(chunk_size=1):
+        yield from json.loads(results_json)
+
+def iter_report_sections(job):
+    """(section title, lazy results, JUnit counts) for each section of a job, in report order"""
+    types_stats, field_stats, _ = load_job_summary(job)
+    for (section, title), stats in zip(ValidationJobResult.SECTION_CHOICES, (types_stats, field_stats)):
+        counts = {
+            'tests': count_section_results(job, section),
+            'failures': stats.totals['failed'],
+            'errors': stats.totals['error']
+        }
+        yield title, iter_job_results(job, section), counts
+
+def load_results_page(job, section, filters, page_number, per_page=VALIDATION_RESULTS_PAGE_SIZE):
+    """One page of a job section's results, filtered by status, PartitionKey and rule"""
+    results = StoredResults(job, section, filter_positions(job, section, filters))
+    return Paginator(results, per_page).get_page(page_number)
+
+def load_filter_options(job):
+    """Every status, PartitionKey and rule that can be filtered on, across both sections"""
+    options = {facet: set() for facet, _ in ValidationJobIndex.FACET_CHOICES}
+    for facet, value in job.result_index.filter(sequence=0).values_list('facet', 'value'):
+        options[facet].add(value)
+    return {facet: sorted(values) for facet, values in options.items()}
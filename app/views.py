@@ -1,39 +1,64 @@
 from django.shortcuts import render, redirect, get_object_or_404
+from django.urls import reverse
 from django.contrib import messages
 from django.db import IntegrityError
 from django.core.exceptions import ValidationError
-from django.http import FileResponse, HttpResponse, JsonResponse
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.template.loader import render_to_string
+from django.utils.html import escape
 from . import settings
-import os
-from .models import RecordType, Stage, CoreField, CustomField, Role
+from .models import RecordType, Stage, CoreField, CustomField, Role, ValidationJob
 import re
+import hashlib
 from . import export
 from django.contrib.auth.decorators import login_required, user_passes_test
-import tempfile
-import shutil
 import json
-from .export import export_record_fields
 from azure.data.tables import TableServiceClient
 from azure.core.exceptions import AzureError
-from django.views.decorators.http import require_POST
+from django.views.decorators.http import condition, require_POST
 from django.views.decorators.csrf import csrf_protect
 from datetime import datetime
 import logging
-import csv
+import time
 from io import StringIO
+from urllib.parse import urlencode
 
 from .utils.record_type_validator import (
-    test_validate_record_type_from_json,
+    validate_record_type_rows,
+    iter_validate_record_types,
     validate_record_type
 )
-from .utils.record_field_validator import test_validate_record_fields_from_json
-from .utils.csv_parser import parse_csv_to_json
+from .utils.record_field_validator import (
+    iter_validate_record_fields,
+    validate_record_field_rows,
+    build_field_key_index
+)
+from .utils.upload_reader import iter_upload_records, open_upload, paired_uploads
+from .utils.validation_stats import ValidationStats
+from .utils.validation_trace import ValidationTrace
+from .utils.record_type_catalog import RecordTypeCatalog
+from .utils.validation_report import (
+    REPORT_FORMATS,
+    iter_csv_report,
+    iter_junit_report,
+    iter_ndjson_report
+)
+from .utils.validation_cache import (
+    validation_cache_key,
+    get_cached_validation,
+    set_cached_validation
+)
 from .utils.constants import (
     CORE_FIELDS,
     IGNORED_SP_FIELDS,
-    IGNORED_STATE_FIELDS
+    IGNORED_STATE_FIELDS,
+    VALIDATION_STREAM_CHUNK_SIZE,
+    EXPORT_FORMAT_VERSION
 )
 from .forms import CustomFieldForm, RoleForm
+from . import validation_jobs
+from . import config_validation
+from .config_version import bump_configuration_version, configuration_version
 
 logger = logging.getLogger('django.request')
 
@@ -374,6 +399,7 @@ def edit_custom_field(request, record_type, field_name):
     if request.method == 'POST':
         if 'delete' in request.POST:
             custom_field.delete()
+            bump_configuration_version(record_type_obj.pk)
             messages.success(request, f'Field "{field_name}" deleted successfully.')
             return redirect('record_fields', record_type=record_type)
         
@@ -586,6 +612,7 @@ def edit_role(request, record_type, role_id):
     if request.method == 'POST':
         if 'delete' in request.POST:
             role.delete()
+            bump_configuration_version(record_type_obj.pk)
             messages.success(request, f'Role "{role.display_name}" deleted successfully!')
             return redirect('record_fields', record_type=record_type)
         
@@ -635,6 +662,48 @@ def edit_role(request, record_type, role_id):
         'stages': stages
     })
 
+def export_version(request, record_type=None):
+    """
+    (record type ID, version, modified at) an export depends on: of the record
+    type it is limited to, else of the whole configuration. Read once per
+    request, however many of the conditional GET helpers ask.
+    """
+    if not hasattr(request, '_export_version'):
+        record_type_name = record_type or request.GET.get('record_type')
+        record_type_id = None
+        if record_type_name:
+            record_type_id = RecordType.objects.filter(name=record_type_name).values_list('pk', flat=True).first()
+        # A missing record type in the URL is a 404 before any conditional check
+        if record_type and record_type_id is None:
+            raise Http404(f"Unknown record type: {record_type}")
+        request._export_version = (record_type_id, *configuration_version(record_type_id))
+    return request._export_version
+
+def export_variant(request):
+    """The query parameters that change an export's content: its format and record type selection"""
+    return urlencode(
+        [('format', request.GET.get('format', '')), ('record_type', request.GET.get('record_type', ''))]
+        + [('types[]', name) for name in sorted(set(request.GET.getlist('types[]')))]
+    )
+
+def export_etag(request, record_type=None):
+    record_type_id, version, _ = export_version(request, record_type)
+    variant = hashlib.sha256(export_variant(request).encode('utf-8')).hexdigest()[:12]
+    return f"{EXPORT_FORMAT_VERSION}-{record_type_id or 'all'}-{version}-{variant}"
+
+def export_last_modified(request, record_type=None):
+    return export_version(request, record_type)[2]
+
+def cached_export(request, make_chunks, record_type=None):
+    """An export's chunks, reused from the export cache until the configuration it depends on changes"""
+    record_type_id, version, _ = export_version(request, record_type)
+    # Keyed on the parameters that shape the export, so extra query parameters never add entries
+    return export.iter_cached_export(f"{record_type_id}:{version}:{request.path}?{export_variant(request)}", make_chunks)
+
+# Polls with a matching If-None-Match or If-Modified-Since get a 304 before any export code runs
+export_conditions = condition(etag_func=export_etag, last_modified_func=export_last_modified)
+
+@export_conditions
 def export_record_types(request):
     """View to handle record type export"""
     single_record_type = request.GET.get('record_type')
@@ -646,123 +715,72 @@ def export_record_types(request):
         selected_types = request.GET.getlist('types[]')
     
     if export_format == 'csv':
-        # Create CSV response
-        response = HttpResponse(content_type='text/csv')
+        # Rows are written as the record types are read, a chunk at a time
+        response = StreamingHttpResponse(
+            cached_export(request, lambda: export.iter_record_types_csv(selected_types)),
+            content_type='text/csv'
+        )
         response['Content-Disposition'] = 'attachment; filename="record_types_export.csv"'
-        
-        writer = csv.writer(response)
-        # Write headers
-        writer.writerow(['PartitionKey', 'RowKey', 'Category', 'Color', 'IsActive', 
-                        'IsCorrespondenceType', 'Order', 'Prefix', 'StagesJson'])
-        
-        # Get record types data
-        record_types = RecordType.objects.filter(name__in=selected_types) if selected_types else RecordType.objects.all()
-        
-        # Write data rows
-        for record in record_types:
-            stages_json = json.dumps([{
-                "Name": stage.name,
-                "Order": stage.order
-            } for stage in record.stages.all().order_by('order')])
-            
-            writer.writerow([
-                'V1',
-                f"{record.name} ({record.prefix})",
-                record.category,
-                record.colour,
-                record.is_enabled,
-                record.enable_correspondence,
-                record.order,
-                record.prefix,
-                stages_json
-            ])
-        
         return response
     else:
-        # Original JSON export logic
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.json') as tmp_file:
-            filename = tmp_file.name
-            export_data = export.export_record_types(selected_types if selected_types else None)
-            shutil.copy2(export_data, filename)
-            os.remove(export_data)
-            
-            response = FileResponse(
-                open(filename, 'rb'),
-                content_type='application/json',
-                as_attachment=True,
-                filename='record_types_export.json'
-            )
-            response._resource_closers.append(lambda: os.remove(filename))
-            return response
+        # JSON is encoded a chunk of record types at a time, straight into the response
+        response = StreamingHttpResponse(
+            cached_export(request, lambda: export.export_record_types(selected_types if selected_types else None)),
+            content_type='application/json'
+        )
+        response['Content-Disposition'] = 'attachment; filename="record_types_export.json"'
+        return response
 
+@export_conditions
 def export_fields(request, record_type):
     """Export record fields as JSON or CSV"""
     record_type_obj = get_object_or_404(RecordType, name=record_type)
-    fields = CustomField.objects.filter(record_type=record_type_obj)
-    roles = Role.objects.filter(record_type=record_type_obj)
-    core_fields = CoreField.objects.filter(record_type=record_type_obj)
     export_format = request.GET.get('format', 'json')  # Default to JSON
     
     if export_format == 'csv':
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="{record_type.lower().replace(" ", "_")}_fields.csv"'
-        
-        writer = csv.writer(response)
-        # Add SysCategory to headers
-        writer.writerow([
-            'PartitionKey', 
-            'RowKey', 
-            'DisplayName', 
-            'Description', 
-            'FieldType',
-            'FiledType',
-            'IsActive',
-            'IsRequired',
-            'IsNotRequiredOnCreation',
-            'NotEditable',
-            'Order',
-            'ShowInHeader',
-            'WizardPosition',
-            'DataSourceName',
-            'Stages',
-            'SysCategory'  # Added SysCategory
-        ])
-        
-        # Get export data
-        export_data = export_record_fields(record_type_obj, fields, roles, core_fields)
-        
-        # Write data rows
-        for field in export_data:
-            writer.writerow([
-                f"{field.get('PartitionKey', '')} ({record_type_obj.prefix})",
-                field.get('RowKey', ''),
-                field.get('DisplayName', ''),
-                field.get('Description', ''),
-                field.get('FieldType', ''),
-                field.get('FiledType', ''),
-                field.get('IsActive', ''),
-                field.get('IsRequired', ''),
-                field.get('IsNotRequiredOnCreation', ''),
-                field.get('NotEditable', ''),
-                field.get('Order', ''),
-                field.get('ShowInHeader', ''),
-                field.get('WizardPosition', ''),
-                field.get('DataSourceName', ''),
-                field.get('Stages', ''),
-                field.get('SysCategory', '')  # Added SysCategory
-            ])
+        # Rows stream from lazy querysets instead of being built up in memory
+        response = StreamingHttpResponse(
+            cached_export(request, lambda: export.iter_record_fields_csv(record_type_obj), record_type),
+            content_type='text/csv'
+        )
+        response['Content-Disposition'] = f'attachment; filename="{export.record_fields_export_filename(record_type, "csv")}"'
         
         return response
     else:
         # Original JSON export logic remains the same since export_record_fields will now include SysCategory
-        export_data = export_record_fields(record_type_obj, fields, roles, core_fields)
-        json_data = json.dumps(export_data, indent=2)
+        json_data = cached_export(
+            request,
+            lambda: [json.dumps(list(export.iter_record_type_fields(record_type_obj)), indent=2)],
+            record_type
+        )
         
         response = HttpResponse(json_data, content_type='application/json')
-        response['Content-Disposition'] = f'attachment; filename="{record_type.lower().replace(" ", "_")}_fields.json"'
+        response['Content-Disposition'] = f'attachment; filename="{export.record_fields_export_filename(record_type, "json")}"'
         
         return response
 
+BULK_FIELDS_EXPORTS = {
+    'csv': (export.iter_bulk_fields_csv, 'text/csv'),
+    'ndjson': (export.iter_bulk_fields_ndjson, 'application/x-ndjson'),
+    'zip': (export.iter_bulk_fields_zip, 'application/zip'),
+}
+
+@export_conditions
+def export_all_fields(request):
+    """Export the fields of every (or every selected) record type in one pass, as CSV, NDJSON or a zip of CSVs"""
+    export_format = request.GET.get('format', 'csv')
+    if export_format not in BULK_FIELDS_EXPORTS:
+        raise Http404(f"Unknown export format: {export_format}")
+    
+    selected_types = request.GET.getlist('types[]')
+    iter_export, content_type = BULK_FIELDS_EXPORTS[export_format]
+    response = StreamingHttpResponse(
+        cached_export(request, lambda: iter_export(selected_types)),
+        content_type=content_type
+    )
+    response['Content-Disposition'] = f'attachment; filename="record_fields_export.{export_format}"'
+    return response
+
 def get_azure_table_service():
     """Helper function to get Azure Table Service client"""
     conn_str = settings.AZURE_STORAGE_CONNECTION_STRING
@@ -869,117 +887,203 @@ def export_table_data(request, table_name):
             content_type='application/json'
         )
 
+VALIDATION_STREAM_MARKER = '<!-- validation-stream -->'
+
+def iter_validation_stream(request, record_types_file, record_fields_file):
+    """Validate both uploads row by row, yielding rendered HTML chunks as results arrive"""
+    page = render_to_string('test_validation_stream.html', {}, request=request)
+    head, tail = page.split(VALIDATION_STREAM_MARKER)
+    yield head
+    
+    def render_chunks(section, title, results):
+        """Render results in fixed-size chunks with a running progress count"""
+        yield f'<h4 class="mt-4">{title}</h4>'
+        chunk = []
+        processed = 0
+        for result in results:
+            chunk.append(result)
+            if len(chunk) >= VALIDATION_STREAM_CHUNK_SIZE:
+                yield render_to_string('includes/validation_result_chunk.html', {
+                    'results': chunk,
+                    'section': section,
+                    'offset': processed,
+                    'progress': f"{title}: {processed + len(chunk)} validated"
+                })
+                processed += len(chunk)
+                chunk = []
+        yield render_to_string('includes/validation_result_chunk.html', {
+            'results': chunk,
+            'section': section,
+            'offset': processed,
+            'progress': f"{title}: {processed + len(chunk)} validated"
+        })
+    
+    stats = ValidationStats()
+    
+    def track(results):
+        """Count results as they stream past without holding on to them"""
+        for result in results:
+            stats.add(result)
+            yield result
+    
+    try:
+        # The catalog is filled while the types are validated, ready for the field checks
+        record_types = RecordTypeCatalog()
+        yield from render_chunks('type', 'Record Types', track(
+            iter_validate_record_types(record_types.collect(iter_upload_records(record_types_file, 'record_types')))
+        ))
+        
+        # First pass keeps only the (PartitionKey, RowKey) index, second pass validates
+        key_index = build_field_key_index(iter_upload_records(record_fields_file, 'record_fields', include_skipped=True))
+        trace = ValidationTrace('Streaming RecordFields validation')
+        yield from render_chunks('field', 'Record Fields', track(
+            iter_validate_record_fields(
+                iter_upload_records(record_fields_file, 'record_fields'),
+                record_types=record_types,
+                key_index=key_index,
+                trace=trace
+            )
+        ))
+        trace.finish()
+        
+        logger.info(f"Streaming validation complete. Success: {stats.success}, totals: {stats.totals}")
+        if stats.success:
+            yield '<div class="alert alert-success mt-3">All records processed successfully</div>'
+        else:
+            yield '<div class="alert alert-warning mt-3">Some records failed validation</div>'
+        progress = 'Validation complete'
+        
+    except Exception as e:
+        logger.exception("Unexpected error in streaming validation")
+        yield f'<div class="alert alert-danger mt-3">Error processing files: {escape(str(e))}</div>'
+        progress = 'Validation stopped'
+        
+    yield (
+        f"<script>document.getElementById('validationProgress').textContent = '{progress}';"
+        "document.getElementById('validationSpinner').remove();</script>"
+    )
+    yield tail
+
 def test_validation(request):
     """View to test both RecordType and RecordFields validation"""
     logger.info(f"Test validation view accessed - Method: {request.method}")
     
     if request.method == 'POST':
+        started = time.perf_counter()
         try:
             logger.info("Processing validation files")
             
-            # Both files are required
-            if 'record_types_file' not in request.FILES or 'record_fields_file' not in request.FILES:
+            # Both files are required, or a single zip holding both
+            types_upload, fields_upload = paired_uploads(
+                request.FILES.get('record_types_file'),
+                request.FILES.get('record_fields_file')
+            )
+            if types_upload is None or fields_upload is None:
                 logger.warning("Missing required files")
                 messages.error(request, "Both Record Types and Record Fields files are required")
                 return render(request, 'test_validation.html')
             
             # Log file information
-            logger.info(f"Record Types file: {request.FILES['record_types_file'].name}")
-            logger.info(f"Record Fields file: {request.FILES['record_fields_file'].name}")
+            logger.info(f"Record Types file: {types_upload.name}")
+            logger.info(f"Record Fields file: {fields_upload.name}")
+            
+            if request.POST.get('stream') != 'on':
+                # Identical re-uploads are served from the content-addressed cache.
+                # The key hashes the uploads as sent, before anything is decompressed.
+                cache_key = validation_cache_key(types_upload, fields_upload)
+                cached_run = get_cached_validation(cache_key)
+                if cached_run is not None and cached_validation_job_exists(cached_run):
+                    logger.info("Serving validation results from cache")
+                    return validation_run_redirect(cached_run['job_id'], request.POST.get('report'))
+            
+            # gzip and zip uploads are decompressed as they are parsed
+            try:
+                shared_upload = types_upload is fields_upload
+                record_types_file = open_upload(types_upload, 'record_types', by_name=shared_upload)
+                record_fields_file = open_upload(fields_upload, 'record_fields', by_name=shared_upload)
+            except ValueError as e:
+                logger.error(f"Upload decompression error: {str(e)}")
+                messages.error(request, str(e))
+                return render(request, 'test_validation.html')
+            
+            if request.POST.get('stream') == 'on':
+                logger.info("Streaming validation results")
+                response = StreamingHttpResponse(
+                    iter_validation_stream(request, record_types_file, record_fields_file),
+                    content_type='text/html'
+                )
+                response['X-Accel-Buffering'] = 'no'
+                return response
             
             record_type_results = []
             field_results = []
-            record_types = []
+            record_types = RecordTypeCatalog()
             
-            # Process Record Types file
-            record_types_file = request.FILES['record_types_file']
+            # Each upload is read and parsed exactly once, straight from memory
             file_extension = record_types_file.name.split('.')[-1].lower()
             logger.info(f"Processing Record Types file: {record_types_file.name} ({file_extension})")
             
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{file_extension}') as tmp_file:
-                for chunk in record_types_file.chunks():
-                    tmp_file.write(chunk)
-                types_file_path = tmp_file.name
-                logger.info(f"Created temporary file for Record Types: {types_file_path}")
-            
-            # Convert CSV to JSON if necessary
-            if file_extension == 'csv':
-                try:
-                    logger.info("Converting Record Types CSV to JSON")
-                    record_types_data = parse_csv_to_json(record_types_file, 'record_types')
-                    # Write the converted JSON to the temp file
-                    with open(types_file_path, 'w') as json_file:
-                        json.dump(record_types_data, json_file)
-                    logger.info("Successfully converted Record Types CSV to JSON")
-                except ValueError as e:
-                    logger.error(f"CSV conversion error: {str(e)}")
-                    messages.error(request, f"Error in Record Types CSV: {str(e)}")
-                    return render(request, 'test_validation.html')
-            
-            # Validate Record Types and collect valid record type names
-            types_success, record_type_results = test_validate_record_type_from_json(types_file_path)
-            logger.info(f"Record Types validation complete. Success: {types_success}")
-            
-            # Extract valid record type names
-            with open(types_file_path, 'r') as file:
-                types_data = json.load(file)
-                record_types = [rt.get('RowKey') for rt in types_data]
-            
-            # Clean up temporary file
-            os.unlink(types_file_path)
+            try:
+                record_types_data = list(iter_upload_records(record_types_file, 'record_types'))
+            except ValueError as e:
+                logger.error(f"Record Types parse error: {str(e)}")
+                messages.error(request, f"Error in Record Types {file_extension.upper()}: {str(e)}")
+                return render(request, 'test_validation.html')
             
             # Process Record Fields file
-            record_fields_file = request.FILES['record_fields_file']
             file_extension = record_fields_file.name.split('.')[-1].lower()
             logger.info(f"Processing Record Fields file: {record_fields_file.name} ({file_extension})")
             
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{file_extension}') as tmp_file:
-                for chunk in record_fields_file.chunks():
-                    tmp_file.write(chunk)
-                fields_file_path = tmp_file.name
-                logger.info(f"Created temporary file for Record Fields: {fields_file_path}")
+            # CSV and JSON are parsed one record at a time in two passes: the
+            # first builds the uniqueness index (and surfaces malformed files),
+            # the second validates, so the rows are never all held at once
+            try:
+                key_index = build_field_key_index(iter_upload_records(record_fields_file, 'record_fields', include_skipped=True))
+            except ValueError as e:
+                logger.error(f"Record Fields parse error: {str(e)}")
+                messages.error(request, f"Error in Record Fields {file_extension.upper()}: {str(e)}")
+                return render(request, 'test_validation.html')
             
-            # Convert CSV to JSON if necessary
-            all_fields = None
-            if file_extension == 'csv':
-                try:
-                    logger.info("Converting Record Fields CSV to JSON")
-                    all_fields = parse_csv_to_json(record_fields_file, 'record_fields')
-                    # Write the converted JSON to the temp file
-                    with open(fields_file_path, 'w') as json_file:
-                        json.dump(all_fields, json_file)
-                    logger.info("Successfully converted Record Fields CSV to JSON")
-                except ValueError as e:
-                    logger.error(f"CSV conversion error: {str(e)}")
-                    messages.error(request, f"Error in Record Fields CSV: {str(e)}")
-                    return render(request, 'test_validation.html')
+            # Storing a large run's results would hold the request for seconds,
+            # so those uploads are validated as a background job instead,
+            # reusing the index built above
+            field_count = sum(len(rows) for rows in key_index.values())
+            if field_count > settings.VALIDATION_SYNC_MAX_ROWS:
+                job = validation_jobs.submit_validation_job(types_upload, fields_upload, key_index=key_index)
+                set_cached_validation(cache_key, {'job_id': str(job.id)})
+                logger.info(f"Sent {field_count} Record Fields rows to validation job {job.id}")
+                return validation_run_redirect(job.id, request.POST.get('report'))
             
-            # Read all fields for duplicate checking if not already loaded
-            if all_fields is None:
-                with open(fields_file_path, 'r') as file:
-                    all_fields = json.load(file)
+            # Validate Record Types, then index them for the field checks
+            types_success, record_type_results = validate_record_type_rows(record_types_data)
+            logger.info(f"Record Types validation complete. Success: {types_success}")
+            record_types = RecordTypeCatalog(record_types_data)
             
-            # Validate Record Fields with record types list
-            fields_success, field_results = test_validate_record_fields_from_json(
-                fields_file_path,
+            fields_success, field_results = validate_record_field_rows(
+                iter_upload_records(record_fields_file, 'record_fields'),
                 record_types=record_types,
-                all_fields=all_fields
+                workers=settings.VALIDATION_WORKERS,
+                key_index=key_index
             )
             logger.info(f"Record Fields validation complete. Success: {fields_success}")
             
-            # Clean up temporary file
-            os.unlink(fields_file_path)
-            
             # Determine overall success
             overall_success = types_success and fields_success
-            logger.info(f"Overall validation complete. Success: {overall_success}")
+            logger.info(
+                f"Overall validation complete. Success: {overall_success} "
+                f"({time.perf_counter() - started:.3f}s)"
+            )
+            
+            # Results are kept server-side and rendered a page at a time
+            job = validation_jobs.store_validation_run(
+                types_upload.name,
+                fields_upload.name,
+                record_type_results,
+                field_results
+            )
+            set_cached_validation(cache_key, {'job_id': str(job.id)})
             
-            return render(request, 'test_validation.html', {
-                'results': True,
-                'success': overall_success,
-                'record_type_results': record_type_results,
-                'field_results': field_results
-            })
+            return validation_run_redirect(job.id, request.POST.get('report'))
             
         except Exception as e:
             logger.exception("Unexpected error in test_validation view")
@@ -988,6 +1092,133 @@ def test_validation(request):
     
     return render(request, 'test_validation.html')
 
+def cached_validation_job_exists(cached_run):
+    """Whether a cached run's job can still be served: not pruned, and not failed"""
+    return ValidationJob.objects.filter(pk=cached_run['job_id']).exclude(status='failed').exists()
+
+def validation_run_redirect(job_id, report_format=None):
+    """Redirect to a stored run's results page, or straight to its report when a format was requested"""
+    if report_format in REPORT_FORMATS:
+        return redirect('validation_job_report', job_id=job_id, report_format=report_format)
+    return redirect('validation_job_results', job_id=job_id)
+
+def validate_current_configuration(request):
+    """Validate the record types and fields currently in the database, without exporting them"""
+    try:
+        success, record_type_results, field_results = config_validation.validate_current_configuration()
+        job = validation_jobs.store_validation_run(
+            'Current configuration',
+            'Current configuration',
+            record_type_results,
+            field_results
+        )
+    except Exception as e:
+        logger.exception("Unexpected error validating the current configuration")
+        messages.error(request, f"Error validating current configuration: {str(e)}")
+        return render(request, 'test_validation.html')
+    
+    return validation_run_redirect(job.id, request.GET.get('report'))
+
+@require_POST
+def submit_validation_job(request):
+    """Queue a background validation job and return its ID"""
+    types_upload, fields_upload = paired_uploads(
+        request.FILES.get('record_types_file'),
+        request.FILES.get('record_fields_file')
+    )
+    if types_upload is None or fields_upload is None:
+        return JsonResponse({'error': 'Both Record Types and Record Fields files are required'}, status=400)
+    if types_upload is fields_upload:
+        # A zip standing in for both files must hold both, checked before queueing
+        try:
+            open_upload(types_upload, 'record_types', by_name=True)
+            open_upload(fields_upload, 'record_fields', by_name=True)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+    
+    # An identical upload reuses its queued, running or finished job
+    cache_key = validation_cache_key(types_upload, fields_upload)
+    cached_run = get_cached_validation(cache_key)
+    if cached_run is not None and cached_validation_job_exists(cached_run):
+        job = ValidationJob.objects.get(pk=cached_run['job_id'])
+    else:
+        job = validation_jobs.submit_validation_job(types_upload, fields_upload)
+        set_cached_validation(cache_key, {'job_id': str(job.id)})
+    return JsonResponse({
+        'job_id': str(job.id),
+        'status_url': reverse('validation_job_status', args=[job.id])
+    }, status=202)
+
+def validation_job_status(request, job_id):
+    """Report a validation job's progress for polling"""
+    # A job whose worker died would otherwise be polled as running forever
+    validation_jobs.fail_stale_jobs()
+    job = get_object_or_404(ValidationJob, pk=job_id)
+    return JsonResponse({
+        'job_id': str(job.id),
+        'status': job.status,
+        'stage': job.stage,
+        'processed': job.processed,
+        'total': job.total,
+        'success': job.success,
+        'error': job.error,
+        'results_url': reverse('validation_job_results', args=[job.id])
+    })
+
+def validation_job_results(request, job_id):
+    """
+    Render one page of a validation run's stored results, filtered by status,
+    PartitionKey and rule; partial while the job is still running
+    """
+    job = get_object_or_404(ValidationJob, pk=job_id)
+    
+    if job.status == 'failed':
+        messages.error(request, f"Error processing files: {job.error}")
+    elif job.status != 'done':
+        messages.info(request, f"Validation is still running ({job.processed} of {job.total} rows) - showing partial results")
+    
+    filters = {
+        facet: request.GET[facet]
+        for facet in ('status', 'partition_key', 'rule')
+        if request.GET.get(facet)
+    }
+    record_type_stats, field_stats, validation_trace = validation_jobs.load_job_summary(job)
+    
+    return render(request, 'test_validation.html', {
+        'results': True,
+        'success': bool(job.success),
+        'job': job,
+        'record_type_page': validation_jobs.load_results_page(job, 'types', filters, request.GET.get('types_page')),
+        'field_page': validation_jobs.load_results_page(job, 'fields', filters, request.GET.get('page')),
+        'record_type_stats': record_type_stats,
+        'field_stats': field_stats,
+        'validation_trace': validation_trace,
+        'filters': filters,
+        'filter_options': validation_jobs.load_filter_options(job),
+        'filter_query': urlencode(filters)
+    })
+
+def validation_job_report(request, job_id, report_format):
+    """Stream a validation run's stored results as an NDJSON, CSV or JUnit XML report"""
+    job = get_object_or_404(ValidationJob, pk=job_id)
+    if report_format not in REPORT_FORMATS:
+        raise Http404(f"Unknown report format: {report_format}")
+    
+    # Results are read back one stored chunk at a time as the response is sent
+    sections = validation_jobs.iter_report_sections(job)
+    if report_format == 'junit':
+        content = iter_junit_report(f"Validation {job.id}", sections)
+    else:
+        rows = ((title, results) for title, results, _ in sections)
+        content = iter_ndjson_report(rows) if report_format == 'ndjson' else iter_csv_report(rows)
+    
+    content_type, extension = REPORT_FORMATS[report_format]
+    response = StreamingHttpResponse(content, content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="validation_{job.id}.{extension}"'
+    # Lets CI tell a finished report from a partial one
+    response['X-Validation-Status'] = job.status
+    return response
+
 def delete_record_types(request):
     if request.method == 'POST':
         record_type_names = request.POST.getlist('types[]')
@@ -0,0 +1,71 @@
+"""
+Times Record Fields validation of a CSV upload at 1k, 10k and 100k rows.
+
+Runs the same two passes as the upload view (index the keys, then validate)
+and fails if the per-row cost grows with the upload size.
+
+    python benchmarks/record_field_validation.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+
+import django
+
+django.setup()
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from app.utils.record_field_validator import build_field_key_index, validate_record_field_rows
+from app.utils.record_type_catalog import RecordTypeCatalog
+from app.utils.upload_reader import iter_upload_records
+
+SIZES = (1_000, 10_000, 100_000)
+RECORD_TYPES = 10
+# Per-row time at the largest size may be at most this multiple of the smallest
+MAX_SLOWDOWN = 2.0
+
+COLUMNS = ['PartitionKey', 'RowKey', 'DisplayName', 'FieldType', 'IsActive', 'IsRequired', 'Order']
+
+def make_upload(rows):
+    """A semicolon-separated Record Fields CSV with rows fields spread over the record types."""
+    lines = [';'.join(COLUMNS)]
+    for i in range(rows):
+        lines.append(';'.join([
+            f"Type{i % RECORD_TYPES}", f"ABCField{i}", f"Field {i}", '1', 'true', 'false', str(i),
+        ]))
+    return SimpleUploadedFile('fields.csv', '\n'.join(lines).encode('utf-8'))
+
+def run(rows):
+    upload = make_upload(rows)
+    record_types = RecordTypeCatalog([
+        {'RowKey': f"Type{i}", 'Prefix': f"T{i}", 'Category': 'Benchmark', 'Order': i}
+        for i in range(RECORD_TYPES)
+    ])
+    started = time.perf_counter()
+    key_index = build_field_key_index(iter_upload_records(upload, 'record_fields', include_skipped=True))
+    _, results = validate_record_field_rows(
+        iter_upload_records(upload, 'record_fields'),
+        record_types=record_types,
+        key_index=key_index
+    )
+    elapsed = time.perf_counter() - started
+    assert len(results) == rows, f"expected {rows} results, got {len(results)}"
+    return elapsed
+
+def main():
+    per_row = {}
+    for rows in SIZES:
+        elapsed = run(rows)
+        per_row[rows] = elapsed / rows
+        print(f"{rows:>7} rows  {elapsed:8.3f}s  {per_row[rows] * 1e6:7.2f}us/row")
+    slowdown = per_row[SIZES[-1]] / per_row[SIZES[0]]
+    print(f"per-row slowdown {SIZES[0]} -> {SIZES[-1]}: {slowdown:.2f}x")
+    if slowdown > MAX_SLOWDOWN:
+        sys.exit(f"validation is not linear: per-row time grew {slowdown:.2f}x")
+
+if __name__ == '__main__':
+    main()
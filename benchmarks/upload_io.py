@@ -0,0 +1,81 @@
+"""
+Measures the file I/O and latency of a synchronous test_validation POST of
+a CSV Record Types/Record Fields pair, read from /proc/self/io around each
+request made through the Django test client.
+
+    python benchmarks/upload_io.py [--root CHECKOUT]
+
+--root points at another checkout (e.g. a git worktree of an older
+commit) to compare against. Logging is disabled and the validation cache
+is kept in memory, so the counters only see the view's own file I/O.
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+SIZES = (1_000, 10_000)
+RUNS = 5
+IO_COUNTERS = ('rchar', 'wchar', 'syscr', 'syscw', 'write_bytes')
+
+def io_counters():
+    with open('/proc/self/io') as io:
+        counters = dict(line.split(': ') for line in io.read().splitlines())
+    return {name: int(counters[name]) for name in IO_COUNTERS}
+
+def record_types_csv():
+    return 'RowKey;Prefix;Category;Order;Description\n' + ''.join(
+        f"Type{i};T{i};Benchmark;{i};Type {i}\n" for i in range(10)
+    )
+
+def record_fields_csv(rows):
+    return 'PartitionKey;RowKey;DisplayName;FieldType;IsActive;IsRequired;Order\n' + ''.join(
+        f"Type{i % 10};ABCField{i};Field {i};1;true;false;{i}\n" for i in range(rows)
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--root', default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    root = os.path.abspath(parser.parse_args().root)
+    sys.path.insert(0, root)
+    os.chdir(root)
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+
+    import django
+    from django.conf import settings
+    django.setup()
+    settings.CACHES['validation'] = {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+    logging.disable(logging.CRITICAL)
+
+    from django.core.cache import caches
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import setup_test_environment
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+
+    client = Client()
+    for rows in SIZES:
+        types_csv = record_types_csv().encode('utf-8')
+        fields_csv = record_fields_csv(rows).encode('utf-8')
+        timings, deltas = [], []
+        for _ in range(RUNS):
+            caches['validation'].clear()
+            before = io_counters()
+            started = time.perf_counter()
+            response = client.post('/test-validation/', {
+                'record_types_file': SimpleUploadedFile('types.csv', types_csv),
+                'record_fields_file': SimpleUploadedFile('fields.csv', fields_csv),
+            })
+            timings.append(time.perf_counter() - started)
+            after = io_counters()
+            assert response.status_code in (200, 302), response.status_code
+            deltas.append({name: after[name] - before[name] for name in IO_COUNTERS})
+        counters = ', '.join(f"{name} {statistics.median(delta[name] for delta in deltas)}" for name in IO_COUNTERS)
+        print(f"{rows:>6} rows  {statistics.median(timings) * 1000:7.0f}ms  {counters}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Measures what each gunicorn worker pays to load the app: the time to
+import app.views after django.setup(), and the worker's resident memory
+once it has served a request.
+
+    python benchmarks/worker_startup.py [--root CHECKOUT]
+
+--root points at another checkout (e.g. a git worktree of an older
+commit) to compare against.
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+RUNS = 5
+
+IMPORT_SCRIPT = """
+import os, sys, time
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+started = time.perf_counter()
+import django
+django.setup()
+import app.views
+elapsed = time.perf_counter() - started
+with open('/proc/self/status') as status:
+    rss = next(line for line in status if line.startswith('VmRSS')).split()[1]
+print(elapsed, rss, 'pandas' in sys.modules)
+"""
+
+def vm_rss(pid):
+    """Resident memory of a process in kB"""
+    with open(f"/proc/{pid}/status") as status:
+        return int(next(line for line in status if line.startswith('VmRSS')).split()[1])
+
+def import_cost(root):
+    """Median (seconds, RSS kB) of importing app.views in a fresh interpreter, and whether pandas was loaded"""
+    timings, rss, pandas_loaded = [], [], False
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, '-c', IMPORT_SCRIPT],
+            cwd=root, capture_output=True, text=True, check=True
+        ).stdout.split()
+        timings.append(float(output[0]))
+        rss.append(int(output[1]))
+        pandas_loaded = output[2] == 'True'
+    return statistics.median(timings), statistics.median(rss), pandas_loaded
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+def worker_rss(root):
+    """RSS in kB of a single booted gunicorn worker after its first request"""
+    port = free_port()
+    master = subprocess.Popen(
+        ['gunicorn', 'app.wsgi', '--workers', '1', '--bind', f"127.0.0.1:{port}"],
+        cwd=root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/test-validation/", timeout=5)
+                break
+            except urllib.error.HTTPError:
+                # Any response means the worker resolved the URLconf and imported the views
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.2)
+        with open(f"/proc/{master.pid}/task/{master.pid}/children") as children:
+            worker_pid = int(children.read().split()[0])
+        return vm_rss(worker_pid)
+    finally:
+        master.terminate()
+        master.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--root', default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    root = os.path.abspath(parser.parse_args().root)
+
+    seconds, import_rss, pandas_loaded = import_cost(root)
+    print(f"import app.views: {seconds * 1000:.0f}ms, RSS {import_rss / 1024:.1f} MB, pandas loaded: {pandas_loaded}")
+    print(f"gunicorn worker after first request: RSS {worker_rss(root) / 1024:.1f} MB")
+
+if __name__ == '__main__':
+    main()